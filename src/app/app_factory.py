@@ -0,0 +1,144 @@
+"""Application factory: wires config, registries and services together.
+
+Log calls in this module use %-style arguments so that message formatting
+is deferred until the logging framework decides the record is emitted.
+"""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from src.app.core.service_factory import FeatureRegistry, ServiceFactory, ServiceRegistry
+from src.core.config import Config, load_config
+from src.core.config_validator import ensure_valid_config
+
+logger = logging.getLogger(__name__)
+
+#: Features that are always registered with the application.
+MANAGEMENT_FEATURES = ["tunnel_management", "district_management", "link_collector"]
+
+
+@dataclass(slots=True)
+class ApplicationContext:
+    """Everything a page or component needs to talk to the application."""
+
+    config: Config
+    service_factory: ServiceFactory
+    feature_registry: FeatureRegistry
+    _initialized: bool = False
+    _service_cache: dict = field(default_factory=dict)
+
+    def get_service(self, service_name: str):
+        """Return the named service, memoized per context.
+
+        Streamlit reruns ask for the same services over and over; caching
+        here skips the factory dispatch after the first lookup.
+        """
+        service = self._service_cache.get(service_name)
+        if service is None:
+            service = self.service_factory.create_service(service_name)
+            self._service_cache[service_name] = service
+        return service
+
+    def is_feature_enabled(self, feature_name: str) -> bool:
+        return self.feature_registry.is_feature_enabled(feature_name)
+
+    def mark_initialized(self) -> None:
+        self._initialized = True
+
+    def is_initialized(self) -> bool:
+        return self._initialized
+
+
+class ApplicationFactory:
+    """Creates fully-wired application contexts."""
+
+    @staticmethod
+    def create_application(config_override: Optional[Config] = None) -> ApplicationContext:
+        """Create and initialize the full application context."""
+        # In container deployments there is no .env file; skip the dotenv
+        # parent-directory walk unless one is actually present.
+        if os.environ.get("ECOGUIDE_SKIP_DOTENV") != "1" and os.path.exists(".env"):
+            load_dotenv(override=False)
+        if config_override is None:
+            config = ensure_valid_config(load_config())
+        else:
+            # Caller-supplied configs (tests, tooling) are treated as
+            # known-valid; skip the full rule traversal.
+            config = config_override
+
+        service_registry = ServiceRegistry()
+        feature_registry = FeatureRegistry()
+        feature_registry.register_feature(
+            "openai_vision", available=bool(config.openai.api_key)
+        )
+        for feature_name in MANAGEMENT_FEATURES:
+            feature_registry.register_feature(feature_name)
+        logger.info(
+            "Feature registry created with %d features", len(feature_registry)
+        )
+
+        service_factory = ServiceFactory(service_registry, config)
+        ApplicationFactory._setup_feature_services(
+            service_registry, feature_registry, config
+        )
+
+        context = ApplicationContext(config, service_factory, feature_registry)
+        context.mark_initialized()
+        logger.info("Application created successfully")
+        return context
+
+    @staticmethod
+    def _setup_feature_services(service_registry: ServiceRegistry,
+                                feature_registry: FeatureRegistry,
+                                config: Config) -> None:
+        """Enable the features the current environment supports."""
+        if feature_registry.enable_and_flag(
+                "openai_vision", service_registry, "openai_enabled", True):
+            logger.info("OpenAI vision feature enabled")
+        else:
+            logger.info("OpenAI vision feature unavailable (no API key)")
+
+        enabled = feature_registry.enable_features_if_available(MANAGEMENT_FEATURES)
+        logger.info("Management features enabled: %s", enabled)
+
+    @staticmethod
+    def create_minimal_application(config: Optional[Config] = None) -> ApplicationContext:
+        """Create a bare context with empty registries (used by tests/tools).
+
+        The registries are fresh per call: they accumulate services and
+        feature flags as the context is used, so sharing them would leak
+        state between otherwise independent minimal contexts.
+        """
+        cfg = config or load_config()
+        service_registry = ServiceRegistry()
+        feature_registry = FeatureRegistry()
+        service_factory = ServiceFactory(service_registry, cfg)
+        return ApplicationContext(cfg, service_factory, feature_registry)
+
+
+_app_context: Optional[ApplicationContext] = None
+
+
+def initialize_application(config: Optional[Config] = None) -> ApplicationContext:
+    """(Re)initialize the global application context."""
+    global _app_context
+    _app_context = ApplicationFactory.create_application(config)
+    return _app_context
+
+
+def get_application() -> ApplicationContext:
+    """Return the global application context, initializing it if needed."""
+    global _app_context
+    if _app_context is None:
+        _app_context = ApplicationFactory.create_application()
+    return _app_context
+
+
+def reset_application() -> None:
+    """Drop the global application context (tests)."""
+    global _app_context
+    _app_context = None
@@ -0,0 +1,203 @@
+"""Base classes for application services.
+
+Services wrap an external capability (OpenAI, file storage, ...) behind a
+common lifecycle: construct → initialize → ready, with health checks and
+restart/disable support.
+
+Log calls use %-style arguments so formatting is deferred until the record
+is actually emitted.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+
+class ServiceStatus(str, Enum):
+    """Service lifecycle states.
+
+    The str mixin means members *are* their value, so they serialize to
+    JSON and compare against plain strings without any ``.value`` hops.
+    """
+
+    UNINITIALIZED = "uninitialized"
+    INITIALIZING = "initializing"
+    READY = "ready"
+    ERROR = "error"
+    DISABLED = "disabled"
+
+
+class HealthCheckResult:
+    """Result of a service health check."""
+
+    def __init__(self, healthy: bool, message: str = "",
+                 details: Optional[Dict[str, Any]] = None):
+        self.healthy = healthy
+        self.message = message
+        self.details = dict(details) if details else {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.healthy,
+            "message": self.message,
+            "details": self.details,
+        }
+
+
+#: Pre-built health results for the statuses whose message never varies, so
+#: probing a not-ready service allocates nothing after module import.
+_UNHEALTHY_RESULTS: Dict[ServiceStatus, HealthCheckResult] = {
+    status: HealthCheckResult(
+        healthy=False,
+        message="Service not ready: " + status,
+        details={"status": status, "error": None},
+    )
+    for status in (ServiceStatus.UNINITIALIZED, ServiceStatus.INITIALIZING,
+                   ServiceStatus.DISABLED)
+}
+
+_HEALTHY_NO_DETAILS = HealthCheckResult(healthy=True, message="OK")
+
+#: Shared empty mapping for services constructed without extra dependencies,
+#: so each instance does not carry its own empty dict.
+_NO_DEPENDENCIES: Dict[str, Any] = {}
+
+
+class BaseService(ABC):
+    """Common lifecycle and health-check behaviour for all services.
+
+    The class hierarchy uses ``__slots__``; subclasses that add instance
+    attributes should declare their own ``__slots__`` to stay dict-free.
+    """
+
+    __slots__ = ("config", "_status", "_error_message", "_dependencies")
+
+    #: Per-class logger; overwritten for every subclass in __init_subclass__
+    #: so instances share it instead of calling logging.getLogger each time.
+    _logger = logging.getLogger(__name__)
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+
+    def __init__(self, config: Any, **kwargs: Any):
+        self.config = config
+        self._status = ServiceStatus.UNINITIALIZED
+        self._error_message: Optional[str] = None
+        self._dependencies = kwargs if kwargs else _NO_DEPENDENCIES
+        name = self.get_service_name()
+        try:
+            self._status = ServiceStatus.INITIALIZING
+            self._initialize()
+            self._status = ServiceStatus.READY
+            self._logger.info("Service %s initialized successfully", name)
+        except Exception as e:
+            self._status = ServiceStatus.ERROR
+            self._error_message = str(e)
+            self._logger.error("Service %s initialization failed: %s", name, e)
+
+    @abstractmethod
+    def get_service_name(self) -> str:
+        """Return the canonical name of this service."""
+
+    @abstractmethod
+    def _initialize(self) -> None:
+        """Perform service-specific initialization; raise on failure."""
+
+    def _perform_health_checks(self) -> Dict[str, Any]:
+        """Service-specific extra health details; override as needed."""
+        return {}
+
+    def is_ready(self) -> bool:
+        return self._status == ServiceStatus.READY
+
+    def get_status(self) -> ServiceStatus:
+        return self._status
+
+    def health_check(self) -> HealthCheckResult:
+        """Return the current health of the service."""
+        if self._status is ServiceStatus.READY:
+            additional_checks = self._perform_health_checks()
+            if not additional_checks:
+                return _HEALTHY_NO_DETAILS
+            return HealthCheckResult(
+                healthy=True,
+                message="OK",
+                details=additional_checks,
+            )
+        if self._status is ServiceStatus.ERROR:
+            # Only the ERROR message varies per instance; build it fresh.
+            return HealthCheckResult(
+                healthy=False,
+                message="Service not ready: " + self._status,
+                details={
+                    "status": self._status,
+                    "error": self._error_message,
+                },
+            )
+        return _UNHEALTHY_RESULTS[self._status]
+
+    def restart(self) -> bool:
+        """Re-run initialization; returns True when the service comes back ready."""
+        name = self.get_service_name()
+        self._logger.info("Restarting service %s", name)
+        self._status = ServiceStatus.INITIALIZING
+        self._error_message = None
+        try:
+            self._initialize()
+            self._status = ServiceStatus.READY
+            self._logger.info("Service %s restarted successfully", name)
+            return True
+        except Exception as e:
+            self._status = ServiceStatus.ERROR
+            self._error_message = str(e)
+            self._logger.error("Service %s restart failed: %s", name, e)
+            return False
+
+    def disable(self) -> None:
+        """Put the service into the DISABLED state."""
+        self._status = ServiceStatus.DISABLED
+        self._logger.info("Service %s disabled", self.get_service_name())
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} status={self._status.value}>"
+
+
+class ConfigurableService(BaseService):
+    """A service carrying a mutable service-local configuration dict."""
+
+    __slots__ = ("_service_config",)
+
+    def __init__(self, config: Any, service_config: Optional[Dict[str, Any]] = None,
+                 **kwargs: Any):
+        self._service_config = (service_config or {}).copy()
+        super().__init__(config, **kwargs)
+
+    def get_service_config(self) -> Mapping[str, Any]:
+        """Read-only view of the service config; copy it before mutating."""
+        return MappingProxyType(self._service_config)
+
+    def update_config(self, updates: Dict[str, Any]) -> bool:
+        """Apply config updates, rolling back if application fails."""
+        if not self._validate_config(updates):
+            return False
+        try:
+            # Snapshot only once validation has passed, so the happy path
+            # before that point pays no copy.
+            old_config = dict(self._service_config)
+            self._service_config.update(updates)
+            self._apply_config_changes(updates)
+            return True
+        except Exception as e:
+            self._service_config = old_config
+            self._logger.error("Config update failed, rolled back: %s", e)
+            return False
+
+    def _validate_config(self, updates: Dict[str, Any]) -> bool:
+        """Validate config updates before applying; override as needed."""
+        return True
+
+    def _apply_config_changes(self, updates: Dict[str, Any]) -> None:
+        """React to applied config changes; override as needed."""
@@ -0,0 +1,160 @@
+"""Service and feature registries plus the service factory.
+
+The registries are plain in-process containers: ``ServiceRegistry`` tracks
+constructed service instances and boolean feature flags, ``FeatureRegistry``
+tracks which application features are available/enabled, and
+``ServiceFactory`` lazily constructs services on demand.
+"""
+
+import importlib
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceRegistry:
+    """Holds constructed service instances and global feature flags."""
+
+    def __init__(self):
+        self._services: Dict[str, Any] = {}
+        self._feature_flags: Dict[str, Any] = {}
+
+    def register_service(self, name: str, service: Any) -> None:
+        self._services[name] = service
+
+    def get_service(self, name: str) -> Optional[Any]:
+        return self._services.get(name)
+
+    def has_service(self, name: str) -> bool:
+        return name in self._services
+
+    def set_feature_flag(self, name: str, value: Any) -> None:
+        self._feature_flags[name] = value
+
+    def get_feature_flag(self, name: str, default: Any = None) -> Any:
+        return self._feature_flags.get(name, default)
+
+
+class FeatureState:
+    """Availability/enablement state for a single feature."""
+
+    __slots__ = ("available", "enabled", "config")
+
+    def __init__(self, available: bool = True, enabled: bool = False,
+                 config: Optional[Dict[str, Any]] = None):
+        self.available = available
+        self.enabled = enabled
+        self.config = config or {}
+
+
+class FeatureRegistry:
+    """Tracks which application features are available and enabled.
+
+    Mutations are guarded by a lock so features can be enabled from worker
+    threads (e.g. during parallel startup) without racing each other.
+    """
+
+    def __init__(self):
+        self._features: Dict[str, FeatureState] = {}
+        self._lock = threading.Lock()
+
+    def register_feature(self, name: str, available: bool = True,
+                         config: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            self._features[name] = FeatureState(available=available, config=config)
+
+    def is_feature_available(self, name: str) -> bool:
+        state = self._features.get(name)
+        return state is not None and state.available
+
+    def is_feature_enabled(self, name: str) -> bool:
+        state = self._features.get(name)
+        return state is not None and state.enabled
+
+    def enable_feature(self, name: str) -> bool:
+        with self._lock:
+            state = self._features.get(name)
+            if state is None or not state.available:
+                return False
+            state.enabled = True
+            return True
+
+    def enable_features_if_available(self, names: Iterable[str]) -> List[str]:
+        """Enable every named feature that is available, in one registry pass.
+
+        Returns the names actually enabled.  This avoids the per-feature
+        ``is_feature_available`` + ``enable_feature`` double lookup on the
+        startup path.
+        """
+        enabled: List[str] = []
+        with self._lock:
+            for name in names:
+                state = self._features.get(name)
+                if state is not None and state.available:
+                    state.enabled = True
+                    enabled.append(name)
+        return enabled
+
+    def enable_and_flag(self, feature: str, service_registry: "ServiceRegistry",
+                        flag: str, value: Any) -> bool:
+        """Enable a feature and set its service-registry flag in one write.
+
+        Returns True when the feature was available and enabled; the flag is
+        set to ``value`` on success and to False otherwise.
+        """
+        with self._lock:
+            state = self._features.get(feature)
+            if state is not None and state.available:
+                state.enabled = True
+                service_registry.set_feature_flag(flag, value)
+                return True
+        service_registry.set_feature_flag(flag, False)
+        return False
+
+    def disable_feature(self, name: str) -> bool:
+        with self._lock:
+            state = self._features.get(name)
+            if state is None:
+                return False
+            state.enabled = False
+            return True
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    def list_features(self) -> List[str]:
+        return list(self._features.keys())
+
+    def get_enabled_features(self) -> List[str]:
+        return [name for name, state in self._features.items() if state.enabled]
+
+
+#: Dotted paths of the service classes the factory knows how to build.
+_SERVICE_CLASSES: Dict[str, tuple] = {
+    "openai_service": ("src.services.openai_service", "OpenAIService"),
+}
+
+
+class ServiceFactory:
+    """Builds services on demand and caches the constructed instances."""
+
+    def __init__(self, registry: ServiceRegistry, config: Any):
+        self.registry = registry
+        self.config = config
+
+    def create_service(self, service_name: str) -> Any:
+        """Return the named service, constructing it on first request."""
+        existing = self.registry.get_service(service_name)
+        if existing is not None:
+            return existing
+        entry = _SERVICE_CLASSES.get(service_name)
+        if entry is None:
+            raise ValueError(f"Unknown service: {service_name}")
+        module_path, class_name = entry
+        module = importlib.import_module(module_path)
+        service_cls = getattr(module, class_name)
+        service = service_cls(self.config)
+        self.registry.register_service(service_name, service)
+        return service
@@ -0,0 +1,69 @@
+"""Base classes for page components.
+
+Components receive the application context and render one functional area
+of a page; services are resolved through the context so components stay
+testable without a full app.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+from src.app.app_factory import ApplicationContext
+
+logger = logging.getLogger(__name__)
+
+
+class BaseComponent:
+    """Common plumbing for page components."""
+
+    def __init__(self, app_context: ApplicationContext):
+        self.app_context = app_context
+        self._service_cache: Dict[str, Any] = {}
+
+    def get_service(self, service_name: str) -> Any:
+        """Resolve a service through the application context.
+
+        Resolutions are memoized per component instance, so repeated
+        lookups of the same service within one render cost a single
+        dict hit instead of a context round-trip each time.
+        """
+        if service_name not in self._service_cache:
+            self._service_cache[service_name] = self.app_context.get_service(
+                service_name
+            )
+        return self._service_cache[service_name]
+
+    def is_feature_enabled(self, feature_name: str) -> bool:
+        return self.app_context.is_feature_enabled(feature_name)
+
+
+class AnalysisResultComponent(BaseComponent):
+    """Renders an analysis result, structured when possible."""
+
+    def render(self, result: Optional[Any]) -> None:
+        if not result:
+            st.info("분석 결과가 아직 없습니다.")
+            return
+        # analyze_image returns a payload dict; the displayable text is
+        # its "content" field.  Plain strings render unchanged.
+        if isinstance(result, dict):
+            content = result.get("content")
+            if not content:
+                st.json(result)
+                return
+            result = content
+        self._render_structured_result(result)
+
+    def _render_structured_result(self, result: str) -> None:
+        try:
+            payload = json.loads(result)
+        except json.JSONDecodeError:
+            st.markdown(result)
+            return
+        if isinstance(payload, dict):
+            st.json(payload)
+        else:
+            st.markdown(result)
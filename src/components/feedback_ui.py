@@ -0,0 +1,102 @@
+"""User feedback form shown after an analysis result."""
+
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+
+class FeedbackUI:
+    """Collects user feedback on one analysis result."""
+
+    #: Widget option tuples and the score mapping, allocated once at
+    #: import instead of on every rerun.
+    _SATISFACTION_OPTIONS = (
+        "매우 불만족 😞", "불만족 🙁", "보통 😐", "만족 🙂", "매우 만족 😄",
+    )
+    _SATISFACTION_SCORES = {
+        "매우 불만족 😞": 1,
+        "불만족 🙁": 2,
+        "보통 😐": 3,
+        "만족 🙂": 4,
+        "매우 만족 😄": 5,
+    }
+    _ACCURACY_OPTIONS = ("정확함", "부분적으로 정확함", "부정확함")
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        # The id seeds every widget key, so it must survive reruns:
+        # a fresh timestamp per construction would re-key (and reset)
+        # every widget on each rerun.  setdefault pins it per session.
+        self.feedback_id = st.session_state.setdefault(
+            f"fbid_{session_id}",
+            f"feedback_{session_id}_{int(datetime.now().timestamp())}",
+        )
+
+    def render(
+        self, vision_result: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Render the form; return the feedback payload when submitted."""
+        st.subheader("📝 분석 결과 피드백")
+        satisfaction = self._render_overall_satisfaction()
+        classification = st.radio(
+            "분류 결과가 정확한가요?",
+            self._ACCURACY_OPTIONS,
+            key=f"{self.feedback_id}_classification",
+        )
+        size_accuracy = st.radio(
+            "크기 측정이 정확한가요?",
+            self._ACCURACY_OPTIONS,
+            key=f"{self.feedback_id}_size",
+        )
+        comment = st.text_area(
+            "추가 의견", key=f"{self.feedback_id}_comment"
+        )
+
+        feedback_data: Dict[str, Any] = {
+            "feedback_id": self.feedback_id,
+            "session_id": self.session_id,
+            "satisfaction": satisfaction,
+            "classification": classification,
+            "size_accuracy": size_accuracy,
+            "comment": comment,
+            "submitted_at": datetime.now().isoformat(),
+        }
+        if vision_result is not None:
+            feedback_data["vision_result"] = vision_result
+
+        self._display_feedback_data(feedback_data)
+        if st.button("피드백 제출", key=f"{self.feedback_id}_submit"):
+            logger.info("피드백 제출: %s", self.feedback_id)
+            st.success("피드백이 제출되었습니다. 감사합니다!")
+            return feedback_data
+        return None
+
+    def _render_overall_satisfaction(self) -> int:
+        """Radio for overall satisfaction; returns a 1-5 score."""
+        choice = st.radio(
+            "전체 만족도",
+            self._SATISFACTION_OPTIONS,
+            index=2,
+            horizontal=True,
+            key=f"{self.feedback_id}_satisfaction",
+        )
+        return self._SATISFACTION_SCORES[choice]
+
+    def _display_feedback_data(self, feedback_data: Dict[str, Any]) -> None:
+        """Preview of the payload that will be submitted."""
+        with st.expander("제출될 데이터 확인"):
+            # st.json serializes the whole payload (including a possibly
+            # large vision_result) on every rerun; only do the work when
+            # the user actually asks for the raw view, and cap the size.
+            if st.toggle("원본 데이터 보기", key=f"{self.feedback_id}_raw"):
+                st.code(
+                    json.dumps(
+                        feedback_data, ensure_ascii=False, indent=2
+                    )[:20000],
+                    language="json",
+                )
@@ -0,0 +1,53 @@
+"""Image analysis component: runs the OpenAI vision analysis flow."""
+
+import logging
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+from src.components.base_ui import BaseComponent
+from src.utils.image_utils import jpeg_bytes_from_image
+
+logger = logging.getLogger(__name__)
+
+
+class ImageAnalysisComponent(BaseComponent):
+    """Validates the OpenAI service and executes the analysis."""
+
+    def execute_analysis(self, image_bytes: bytes) -> Optional[Dict[str, Any]]:
+        """Run the full validation + analysis flow for one image."""
+        error = self._validate_openai_service()
+        if error is not None:
+            st.session_state.analysis_error = error
+            st.error(error)
+            return None
+        with st.spinner("이미지를 분석하는 중..."):
+            try:
+                result = self._perform_analysis(image_bytes)
+            except Exception as e:
+                logger.error("이미지 분석 실패: %s", e)
+                st.session_state.analysis_error = str(e)
+                st.error("분석 중 오류가 발생했습니다.")
+                return None
+        st.session_state.analysis_result = result
+        st.session_state.analysis_error = None
+        return result
+
+    def _validate_openai_service(self) -> Optional[str]:
+        """Return a user-facing error message, or None when usable."""
+        service = self.get_service("openai_service")
+        if service is None:
+            return "OpenAI 서비스를 사용할 수 없습니다."
+        if not service.is_ready():
+            return "OpenAI 서비스가 준비되지 않았습니다."
+        if not self.app_context.config.openai.api_key:
+            return "OpenAI API 키가 설정되지 않았습니다."
+        return None
+
+    def _perform_analysis(self, image_bytes: bytes) -> Dict[str, Any]:
+        service = self.get_service("openai_service")
+        jpeg_bytes = jpeg_bytes_from_image(image_bytes)
+        # Drop the last local reference to the original image so the
+        # camera buffer can be reclaimed during the network wait.
+        del image_bytes
+        return service.analyze_image(jpeg_bytes)
@@ -0,0 +1,44 @@
+"""Image input component: camera capture and gallery upload tabs."""
+
+import logging
+from typing import Optional
+
+import streamlit as st
+
+from src.components.base_ui import BaseComponent
+from src.utils.session_state import SessionStateManager
+
+logger = logging.getLogger(__name__)
+
+
+class ImageInputComponent(BaseComponent):
+    """Collects an image from the camera or the photo gallery."""
+
+    def render(self) -> Optional[bytes]:
+        """Render both input tabs and return the selected image bytes."""
+        state = SessionStateManager.init_image_state()
+        camera_tab, gallery_tab = st.tabs(["📷 카메라", "🖼️ 갤러리"])
+        with camera_tab:
+            self._handle_camera_input()
+        with gallery_tab:
+            self._handle_gallery_input()
+        return SessionStateManager.get_selected_image_bytes(state.active_tab)
+
+    def _handle_camera_input(self) -> Optional[bytes]:
+        camera_photo = st.camera_input("사진을 촬영하세요")
+        if camera_photo is None:
+            return None
+        # getvalue() materializes the full frame; call it once and share.
+        data = camera_photo.getvalue()
+        SessionStateManager.update_image_bytes("camera", data)
+        return data
+
+    def _handle_gallery_input(self) -> Optional[bytes]:
+        uploaded = st.file_uploader(
+            "이미지를 선택하세요", type=["jpg", "jpeg", "png", "webp"]
+        )
+        if uploaded is None:
+            return None
+        data = uploaded.getvalue()
+        SessionStateManager.update_image_bytes("gallery", data)
+        return data
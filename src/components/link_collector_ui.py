@@ -0,0 +1,206 @@
+"""Link collector page: browse districts and register guidance links."""
+
+import csv
+import io
+import itertools
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict
+
+import streamlit as st
+
+from src.services.link_collector_service import (
+    create_google_search_url,
+    delete_link,
+    get_districts_by_key,
+    get_districts_data,
+    load_registered_links,
+    save_link,
+)
+
+logger = logging.getLogger(__name__)
+
+#: Column order for the link export.
+_EXPORT_FIELDS = (
+    "시도명", "시군구명", "url", "title", "phone", "note", "updated_at",
+)
+
+#: Sigungu buttons rendered per page; widget cost scales with count and
+#: the nationwide list is ~250 rows.
+_PAGE_SIZE = 25
+
+
+def link_collector_ui() -> None:
+    """Render the link collector page."""
+    st.subheader("🔗 지자체 링크 수집")
+    all_districts = get_districts_data()
+    registered_links = load_registered_links()
+    if not all_districts:
+        st.warning("지역 데이터가 없습니다.")
+        return
+
+    # defaultdict keeps insertion order (the file's sido order) and does
+    # one hash probe per row instead of a membership check plus append.
+    sido_map = defaultdict(list)
+    for d in all_districts:
+        sido_map[d.get("시도명")].append(d)
+
+    manage_tab, export_tab = st.tabs(["📋 링크 관리", "📤 데이터 내보내기"])
+    with manage_tab:
+        selected_sido = st.selectbox("시도 선택", ["전체"] + list(sido_map))
+        if selected_sido == "전체":
+            sigungus_to_display = list(
+                itertools.chain.from_iterable(sido_map.values())
+            )
+        else:
+            sigungus_to_display = sido_map[selected_sido]
+
+        # One pass formats each district's key, applies the filter and
+        # counts registrations, so the key string is built exactly once.
+        only_missing = st.checkbox("미등록만 보기")
+        display_rows = []
+        registered_count = 0
+        for d in sigungus_to_display:
+            district_key = f"{d.get('시도명')}_{d.get('시군구명')}"
+            is_registered = district_key in registered_links
+            if only_missing and is_registered:
+                continue
+            if is_registered:
+                registered_count += 1
+            display_rows.append((district_key, is_registered, d))
+        st.caption(
+            f"{len(display_rows)}개 시군구 중 {registered_count}개 등록됨"
+        )
+
+        list_col, editor_col = st.columns([1, 2])
+        with list_col:
+            page_count = max(1, -(-len(display_rows) // _PAGE_SIZE))
+            page = st.number_input(
+                "페이지", min_value=1, max_value=page_count, value=1, step=1
+            )
+            start = (page - 1) * _PAGE_SIZE
+            with st.container(height=480):
+                for district_key, is_registered, d in display_rows[
+                    start:start + _PAGE_SIZE
+                ]:
+                    mark = "✅" if is_registered else "❌"
+                    if st.button(
+                        f"{mark} {d.get('시군구명')}", key=f"sel_{district_key}"
+                    ):
+                        st.session_state.selected_sigungu_key = district_key
+        with editor_col:
+            selected_key = st.session_state.get("selected_sigungu_key")
+            if not selected_key:
+                st.info("왼쪽 목록에서 시군구를 선택하세요.")
+            else:
+                selected_info = get_districts_by_key().get(selected_key)
+                if selected_info is None:
+                    st.warning("선택한 시군구 정보를 찾을 수 없습니다.")
+                else:
+                    show_sigungu_editor(
+                        selected_key, selected_info, registered_links
+                    )
+    with export_tab:
+        show_data_export(registered_links)
+
+
+@st.fragment
+def show_sigungu_editor(
+    district_key: str,
+    district_info: Dict[str, Any],
+    registered_links: Dict[str, Dict[str, Any]],
+) -> None:
+    """Editor pane for one district's link entry.
+
+    Runs as a fragment (Streamlit >= 1.33): widget changes inside the
+    editor rerun only this subtree, not the whole page with its district
+    grouping and button list.
+    """
+    sido = district_info.get("시도명", "")
+    sigungu = district_info.get("시군구명", "")
+    existing = registered_links.get(district_key, {})
+
+    st.markdown(f"### {sido} {sigungu}")
+    search_url = create_google_search_url(sido, sigungu)
+    st.markdown(f"[🔍 구글에서 배출 안내 검색]({search_url})")
+
+    # The form batches edits: text inputs no longer trigger a script
+    # rerun per keystroke, only the submit does.
+    with st.form(key=f"editor_{district_key}"):
+        url = st.text_input(
+            "안내 페이지 URL", value=existing.get("url", "")
+        )
+        title = st.text_input(
+            "페이지 제목", value=existing.get("title", "")
+        )
+        phone = st.text_input(
+            "담당 부서 전화", value=existing.get("phone", "")
+        )
+        note = st.text_input(
+            "비고", value=existing.get("note", "")
+        )
+        if st.form_submit_button("💾 저장"):
+            link_data = {
+                "url": url,
+                "title": title,
+                "phone": phone,
+                "note": note,
+                "updated_at": datetime.now().isoformat(),
+            }
+            if save_link(district_key, link_data):
+                st.success("저장되었습니다.")
+                st.rerun()
+            else:
+                st.error("저장에 실패했습니다.")
+
+    # Delete stays outside the form: destructive, and should not be
+    # reachable through an accidental form submit.
+    if existing and st.button("🗑️ 삭제", key=f"del_{district_key}"):
+        if delete_link(district_key):
+            st.success("삭제되었습니다.")
+            st.rerun()
+        else:
+            st.error("삭제에 실패했습니다.")
+
+
+def show_data_export(registered_links: Dict[str, Dict[str, Any]]) -> None:
+    """Export pane: download the registered links as CSV or JSON."""
+    if not registered_links:
+        st.info("내보낼 등록 링크가 없습니다.")
+        return
+
+    export_format = st.selectbox("내보내기 형식", ["CSV", "JSON"])
+    # Serialization is gated behind the button and builds only the
+    # selected format, so plain reruns of this tab cost nothing.
+    if not st.button("📦 내보내기 준비"):
+        return
+
+    export_data = []
+    for district_key, link_data in registered_links.items():
+        sido, _, sigungu = district_key.partition("_")
+        export_data.append({
+            "시도명": sido,
+            "시군구명": sigungu,
+            "url": link_data.get("url", ""),
+            "title": link_data.get("title", ""),
+            "phone": link_data.get("phone", ""),
+            "note": link_data.get("note", ""),
+            "updated_at": link_data.get("updated_at", ""),
+        })
+    if export_format == "CSV":
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=_EXPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(export_data)
+        st.download_button(
+            "📥 CSV 다운로드", buf.getvalue(),
+            file_name="registered_links.csv", mime="text/csv",
+        )
+    else:
+        st.download_button(
+            "📥 JSON 다운로드",
+            json.dumps(export_data, ensure_ascii=False, indent=2),
+            file_name="registered_links.json", mime="application/json",
+        )
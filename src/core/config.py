@@ -0,0 +1,64 @@
+"""Application configuration models and environment-based loading."""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class OpenAIConfig:
+    """Settings for the OpenAI vision analysis backend."""
+
+    api_key: str = ""
+    model: str = "gpt-4o-mini"
+    max_tokens: int = 1024
+    temperature: float = 0.2
+
+
+@dataclass
+class AppConfig:
+    """General application settings."""
+
+    debug: bool = False
+    log_level: str = "INFO"
+    base_url: str = "http://localhost:8501"
+    port: int = 8501
+
+
+@dataclass
+class DistrictConfig:
+    """Paths for district data and user uploads."""
+
+    data_dir: Path = Path("data")
+    uploads_dir: Path = Path("uploads")
+
+
+@dataclass
+class Config:
+    """Top-level application configuration."""
+
+    openai: OpenAIConfig = field(default_factory=OpenAIConfig)
+    app: AppConfig = field(default_factory=AppConfig)
+    district: DistrictConfig = field(default_factory=DistrictConfig)
+
+
+def load_config() -> Config:
+    """Build a Config from environment variables with sensible defaults."""
+    return Config(
+        openai=OpenAIConfig(
+            api_key=os.environ.get("OPENAI_API_KEY", ""),
+            model=os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
+            max_tokens=int(os.environ.get("OPENAI_MAX_TOKENS", "1024")),
+            temperature=float(os.environ.get("OPENAI_TEMPERATURE", "0.2")),
+        ),
+        app=AppConfig(
+            debug=os.environ.get("ECOGUIDE_DEBUG", "0") == "1",
+            log_level=os.environ.get("ECOGUIDE_LOG_LEVEL", "INFO"),
+            base_url=os.environ.get("ECOGUIDE_BASE_URL", "http://localhost:8501"),
+            port=int(os.environ.get("ECOGUIDE_PORT", "8501")),
+        ),
+        district=DistrictConfig(
+            data_dir=Path(os.environ.get("ECOGUIDE_DATA_DIR", "data")),
+            uploads_dir=Path(os.environ.get("ECOGUIDE_UPLOADS_DIR", "uploads")),
+        ),
+    )
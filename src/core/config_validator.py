@@ -0,0 +1,389 @@
+"""Rule-based validation for the application configuration.
+
+Each rule targets a dotted config field (e.g. ``openai.model``) and reports a
+ValidationResult.  ``ensure_valid_config`` is the entry point used during
+application startup; it applies auto-fixes for warnings and raises on
+critical problems.
+"""
+
+import logging
+import os
+import re
+from collections import Counter
+from operator import attrgetter
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+#: Patterns and choice tables shared by every validator instance; compiled
+#: once at import instead of per ConfigValidator construction.
+_URL_PATTERN = re.compile(r"^https?://[^\s/$.?#].[^\s]*$")
+_MODEL_CHOICES = ("gpt-4o-mini", "gpt-4o", "gpt-4-turbo")
+_NUM_TYPES = (int, float)
+_PATH_TYPES = (str, Path)
+
+
+class ValidationSeverity(Enum):
+    WARNING = "warning"
+    ERROR = "error"
+    CRITICAL = "critical"
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Outcome of applying a single validation rule to a config field.
+
+    Slotted because dozens of these are created per validation pass; kept
+    mutable so validate_and_fix can flip ``is_valid`` after an auto-fix.
+    """
+
+    is_valid: bool
+    severity: ValidationSeverity
+    field_name: str
+    message: str
+    suggested_value: Any = None
+    current_value: Any = None
+
+
+class ValidationRule(ABC):
+    """Base class for config validation rules."""
+
+    def __init__(self, field_name: str, severity: ValidationSeverity = ValidationSeverity.ERROR):
+        self.field_name = field_name
+        self.severity = severity
+
+    @abstractmethod
+    def validate(self, value: Any) -> ValidationResult:
+        """Validate a single config value."""
+
+    def _fail(self, message: str, current_value: Any = None,
+              suggested_value: Any = None) -> ValidationResult:
+        return ValidationResult(
+            is_valid=False,
+            severity=self.severity,
+            field_name=self.field_name,
+            message=message,
+            suggested_value=suggested_value,
+            current_value=current_value,
+        )
+
+    def _ok(self, current_value: Any = None) -> ValidationResult:
+        return ValidationResult(
+            is_valid=True,
+            severity=self.severity,
+            field_name=self.field_name,
+            message="OK",
+            current_value=current_value,
+        )
+
+
+class RegexValidationRule(ValidationRule):
+    """Validates a string field against a regular expression."""
+
+    def __init__(self, field_name: str, pattern: "Union[str, re.Pattern]",
+                 severity: ValidationSeverity = ValidationSeverity.ERROR):
+        super().__init__(field_name, severity)
+        # Accept pre-compiled patterns so module-level constants are shared
+        # across validator instances without recompilation.
+        self.pattern = pattern if hasattr(pattern, "match") else re.compile(pattern)
+
+    def validate(self, value: Any) -> ValidationResult:
+        if value is None or not isinstance(value, str):
+            return self._fail("문자열 값이 필요합니다", value)
+        if not self.pattern.match(value):
+            return self._fail(f"형식이 올바르지 않습니다: {value}", value)
+        return self._ok(value)
+
+
+class ChoiceValidationRule(ValidationRule):
+    """Validates that a value is one of an allowed set of choices."""
+
+    def __init__(self, field_name: str, choices: "Sequence[Any]", case_sensitive: bool = True,
+                 severity: ValidationSeverity = ValidationSeverity.ERROR):
+        super().__init__(field_name, severity)
+        self.choices = choices
+        self.case_sensitive = case_sensitive
+        # Precomputed sets make the membership test O(1) and avoid the
+        # per-call lowercased list rebuild for case-insensitive rules.
+        self._choice_set = frozenset(choices)
+        self._lower_set = frozenset(
+            c.lower() if isinstance(c, str) else c for c in choices
+        )
+
+    def validate(self, value: Any) -> ValidationResult:
+        if not self.case_sensitive and isinstance(value, str):
+            is_member = value.lower() in self._lower_set
+        else:
+            is_member = value in self._choice_set
+        if not is_member:
+            return self._fail(
+                f"허용되지 않는 값입니다: {value} (허용: {self.choices})",
+                value, suggested_value=self.choices[0],
+            )
+        return self._ok(value)
+
+
+class RangeValidationRule(ValidationRule):
+    """Validates that a numeric value falls within an inclusive range."""
+
+    def __init__(self, field_name: str, min_value: Union[int, float],
+                 max_value: Union[int, float],
+                 severity: ValidationSeverity = ValidationSeverity.WARNING):
+        super().__init__(field_name, severity)
+        self.min_value = min_value
+        self.max_value = max_value
+
+    def validate(self, value: Any) -> ValidationResult:
+        # bool is an int subclass; True/False must not pass numeric ranges.
+        if isinstance(value, bool) or not isinstance(value, _NUM_TYPES):
+            return self._fail(f"숫자 값이 필요합니다: {value!r}", value)
+        if value < self.min_value or value > self.max_value:
+            clamped = min(max(value, self.min_value), self.max_value)
+            return self._fail(
+                f"범위를 벗어났습니다: {value} (허용: {self.min_value}~{self.max_value})",
+                value, suggested_value=clamped,
+            )
+        return self._ok(value)
+
+
+class PathValidationRule(ValidationRule):
+    """Validates filesystem path fields, optionally creating missing directories."""
+
+    def __init__(self, field_name: str, must_exist: bool = False,
+                 is_directory: bool = True, create_if_missing: bool = False,
+                 severity: ValidationSeverity = ValidationSeverity.WARNING):
+        super().__init__(field_name, severity)
+        self.must_exist = must_exist
+        self.is_directory = is_directory
+        self.create_if_missing = create_if_missing
+        # Last path that fully validated; repeat validations of the same
+        # value skip the filesystem entirely.
+        self._verified_ok: Optional[str] = None
+
+    def validate(self, value: Any) -> ValidationResult:
+        if not isinstance(value, _PATH_TYPES):
+            return self._fail(f"경로 값이 필요합니다: {value!r}", value)
+        if self._verified_ok == str(value):
+            return self._ok(value)
+        path = value if isinstance(value, Path) else Path(value)
+        exists = path.exists()
+        if self.create_if_missing and not exists:
+            try:
+                path.mkdir(parents=True, exist_ok=True)
+                exists = True
+            except OSError as e:
+                return self._fail(f"디렉터리를 생성할 수 없습니다: {e}", value)
+        if self.must_exist and not exists:
+            return self._fail(f"경로가 존재하지 않습니다: {path}", value)
+        if self.is_directory and exists and not path.is_dir():
+            return self._fail(f"디렉터리가 아닙니다: {path}", value)
+        self._verified_ok = str(value)
+        return self._ok(value)
+
+
+class EnvironmentVariableRule(ValidationRule):
+    """Validates that a config field backed by an environment variable is set."""
+
+    def __init__(self, field_name: str, env_var_name: str, required: bool = True,
+                 severity: ValidationSeverity = ValidationSeverity.CRITICAL):
+        super().__init__(field_name, severity)
+        self.env_var_name = env_var_name
+        self.required = required
+
+    def validate(self, value: Any,
+                 env: Optional[Mapping[str, str]] = None) -> ValidationResult:
+        env_value = (env if env is not None else os.environ).get(self.env_var_name)
+        if self.required and not value and not env_value:
+            return self._fail(
+                f"환경변수 {self.env_var_name}이(가) 설정되지 않았습니다", value
+            )
+        return self._ok(value)
+
+
+class CustomValidationRule(ValidationRule):
+    """Validates a field with a caller-supplied predicate."""
+
+    def __init__(self, field_name: str, validator: Callable[[Any], bool], message: str,
+                 severity: ValidationSeverity = ValidationSeverity.ERROR):
+        super().__init__(field_name, severity)
+        self.validator = validator
+        self.message = message
+
+    def validate(self, value: Any) -> ValidationResult:
+        if not self.validator(value):
+            return self._fail(self.message, value)
+        return self._ok(value)
+
+
+class ConfigValidator:
+    """Applies a set of validation rules to a Config object."""
+
+    def __init__(self):
+        # field name -> (compiled dotted-attribute getter, rules for the field)
+        self.rules: Dict[str, Tuple[Callable[[Any], Any], List[ValidationRule]]] = {}
+        # Flat (getter, rule) dispatch list; validation walks this directly.
+        self._compiled: List[Tuple[Callable[[Any], Any], ValidationRule]] = []
+        self._setup_default_rules()
+
+    def _setup_default_rules(self) -> None:
+        # WARNING, not CRITICAL: the application is designed to start in a
+        # degraded mode without an API key (app_factory registers the
+        # openai_vision feature as unavailable), so a missing key must not
+        # abort startup.
+        self.add_rule(EnvironmentVariableRule(
+            "openai.api_key", "OPENAI_API_KEY",
+            severity=ValidationSeverity.WARNING,
+        ))
+        self.add_rule(ChoiceValidationRule(
+            "openai.model",
+            _MODEL_CHOICES,
+            case_sensitive=False,
+        ))
+        self.add_rule(RangeValidationRule("openai.max_tokens", 1, 4096))
+        self.add_rule(RangeValidationRule("openai.temperature", 0.0, 2.0))
+        self.add_rule(RangeValidationRule("app.port", 1, 65535))
+        self.add_rule(RegexValidationRule("app.base_url", _URL_PATTERN))
+        self.add_rule(PathValidationRule("district.data_dir", must_exist=False))
+        self.add_rule(PathValidationRule("district.uploads_dir", create_if_missing=True))
+
+    def add_rule(self, rule: ValidationRule) -> None:
+        """Register a rule under its field name.
+
+        The dotted attribute chain is compiled to an ``operator.attrgetter``
+        once here, so validation does not re-split and re-walk it per call.
+        """
+        entry = self.rules.get(rule.field_name)
+        if entry is None:
+            entry = (attrgetter(rule.field_name), [])
+            self.rules[rule.field_name] = entry
+        entry[1].append(rule)
+        self._compiled.append((entry[0], rule))
+        logger.debug("Validation rule added for %s", rule.field_name)
+
+    def _set_nested_value(self, config: Any, field_name: str, new_value: Any) -> None:
+        parts = field_name.split(".")
+        target = config
+        for part in parts[:-1]:
+            target = getattr(target, part)
+        setattr(target, parts[-1], new_value)
+
+    def validate_config(self, config: Any, fail_fast: bool = False,
+                        auto_fix: bool = False) -> List[ValidationResult]:
+        """Run every registered rule against the config.
+
+        With ``fail_fast`` the scan stops at the first CRITICAL failure,
+        since the caller is going to abort anyway.  With ``auto_fix``,
+        fixable warnings are repaired inline so later rules already see
+        the corrected value.
+        """
+        results: List[ValidationResult] = []
+        # Snapshot the environment once per pass so every env-var rule sees
+        # a consistent view and repeated passes avoid per-rule lookups.
+        env_snapshot = {
+            rule.env_var_name: os.environ.get(rule.env_var_name)
+            for _, field_rules in self.rules.values()
+            for rule in field_rules
+            if isinstance(rule, EnvironmentVariableRule)
+        }
+        # Flat dispatch with per-rule error isolation: one rule raising no
+        # longer turns its field's remaining rules into generic errors.
+        for getter, rule in self._compiled:
+            try:
+                value = getter(config)
+                if isinstance(rule, EnvironmentVariableRule):
+                    result = rule.validate(value, env=env_snapshot)
+                else:
+                    result = rule.validate(value)
+            except AttributeError as e:
+                result = ValidationResult(
+                    is_valid=False,
+                    severity=ValidationSeverity.ERROR,
+                    field_name=rule.field_name,
+                    message=f"설정 필드를 찾을 수 없습니다: {e}",
+                )
+            if (auto_fix and not result.is_valid
+                    and result.severity is ValidationSeverity.WARNING
+                    and result.suggested_value is not None):
+                self._set_nested_value(config, rule.field_name, result.suggested_value)
+                result.is_valid = True
+                logger.info("Auto-fixed %s -> %s", rule.field_name, result.suggested_value)
+            results.append(result)
+            if (fail_fast and not result.is_valid
+                    and result.severity is ValidationSeverity.CRITICAL):
+                return results
+        return results
+
+    def validate_and_fix(self, config: Any,
+                         fail_fast: bool = False) -> List[ValidationResult]:
+        """Validate with inline auto-fix of warning-level results."""
+        return self.validate_config(config, fail_fast=fail_fast, auto_fix=True)
+
+    def has_critical(self, results: List[ValidationResult]) -> bool:
+        """True when any invalid result is CRITICAL; allocates nothing."""
+        return any(not r.is_valid and r.severity is ValidationSeverity.CRITICAL
+                   for r in results)
+
+    def get_critical_errors(self, results: List[ValidationResult]) -> List[ValidationResult]:
+        """Return the invalid results with CRITICAL severity."""
+        return [r for r in results
+                if not r.is_valid and r.severity is ValidationSeverity.CRITICAL]
+
+    def get_error_summary(self, results: List[ValidationResult]) -> Dict[str, int]:
+        """Summarize validation results by severity in a single pass."""
+        valid = 0
+        counts = Counter()
+        for r in results:
+            if r.is_valid:
+                valid += 1
+            else:
+                counts[r.severity] += 1
+        return {
+            "valid": valid,
+            "warnings": counts[ValidationSeverity.WARNING],
+            "errors": counts[ValidationSeverity.ERROR],
+            "critical": counts[ValidationSeverity.CRITICAL],
+        }
+
+
+_DEFAULT_VALIDATOR: Optional[ConfigValidator] = None
+
+
+def _get_default_validator() -> ConfigValidator:
+    """Return the process-wide default validator, building it on first use.
+
+    Rule construction (and its regex compilation) happens exactly once per
+    process instead of on every validate_config/ensure_valid_config call.
+    """
+    global _DEFAULT_VALIDATOR
+    if _DEFAULT_VALIDATOR is None:
+        _DEFAULT_VALIDATOR = ConfigValidator()
+    return _DEFAULT_VALIDATOR
+
+
+def validate_config(config: Any, auto_fix: bool = False) -> List[ValidationResult]:
+    """Validate a config with the default rule set."""
+    validator = _get_default_validator()
+    if auto_fix:
+        return validator.validate_and_fix(config)
+    return validator.validate_config(config)
+
+
+def ensure_valid_config(config: Any) -> Any:
+    """Validate (with auto-fix) and return the config, raising on critical errors."""
+    validator = _get_default_validator()
+    results = validator.validate_and_fix(config, fail_fast=True)
+    for result in results:
+        if not result.is_valid:
+            if result.severity is ValidationSeverity.WARNING:
+                logger.warning("Config warning - %s: %s", result.field_name, result.message)
+            else:
+                logger.error("Config error - %s: %s", result.field_name, result.message)
+    if validator.has_critical(results):
+        critical = validator.get_critical_errors(results)
+        messages = [f"{r.field_name}: {r.message}" for r in critical]
+        raise ValueError("설정 검증 실패:\n" + "\n".join(messages))
+    return config
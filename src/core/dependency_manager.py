@@ -0,0 +1,375 @@
+"""Runtime dependency checking for the optional feature groups.
+
+Heavy optional packages (torch, ultralytics, mediapipe, ...) are probed at
+runtime so the app can degrade gracefully when a group is not installed.
+"""
+
+import copy
+import functools
+import importlib
+import logging
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from importlib.metadata import PackageNotFoundError, version as _metadata_version
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DependencyStatus(str, Enum):
+    """Probe outcomes; the str mixin makes members compare as plain strings."""
+
+    UNKNOWN = "unknown"
+    AVAILABLE = "available"
+    MISSING = "missing"
+    VERSION_MISMATCH = "version_mismatch"
+
+
+@dataclass(slots=True)
+class DependencyInfo:
+    """A single runtime dependency and its last observed state."""
+
+    name: str
+    import_name: str
+    min_version: Optional[str] = None
+    max_version: Optional[str] = None
+    is_optional: bool = False
+    description: str = ""
+    status: DependencyStatus = DependencyStatus.UNKNOWN
+    installed_version: Optional[str] = None
+    error_message: Optional[str] = None
+    #: requirements.txt line; pure function of the immutable fields above.
+    requirement_line: str = field(init=False)
+
+    def __post_init__(self):
+        line = self.name
+        if self.min_version:
+            line += f">={self.min_version}"
+        if self.max_version:
+            line += f",<={self.max_version}"
+        if self.is_optional:
+            line += "  # optional"
+        self.requirement_line = line
+
+
+@dataclass(slots=True)
+class DependencyGroup:
+    """A named group of dependencies backing one feature area."""
+
+    name: str
+    description: str
+    dependencies: List[DependencyInfo] = field(default_factory=list)
+    #: Pre-partitioned views so hot paths iterate only the side they need.
+    required_deps: Tuple[DependencyInfo, ...] = field(init=False)
+    optional_deps: Tuple[DependencyInfo, ...] = field(init=False)
+
+    def __post_init__(self):
+        self.required_deps = tuple(
+            dep for dep in self.dependencies if not dep.is_optional
+        )
+        self.optional_deps = tuple(
+            dep for dep in self.dependencies if dep.is_optional
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _pkg_version(dist_name: str) -> Optional[str]:
+    """Installed version from package metadata, or None if not installed.
+
+    Reading the METADATA file avoids touching module attributes, which on
+    packages with lazy (PEP 562) __getattr__ can trigger real work.
+    """
+    try:
+        return _metadata_version(dist_name)
+    except PackageNotFoundError:
+        return None
+
+
+def _get_module_version(module: Any) -> Optional[str]:
+    """Best-effort version lookup on an imported module."""
+    version_attrs = ["__version__", "version", "VERSION"]
+    for attr in version_attrs:
+        if hasattr(module, attr):
+            value = getattr(module, attr)
+            if isinstance(value, str):
+                return value
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_version(version_string: str):
+    """Parse a version string once per process.
+
+    The required-version side of every comparison is a hard-coded literal
+    from the dependency tables, and installed versions repeat across
+    reruns, so caching kills almost all of packaging's regex parsing.
+    """
+    from packaging.version import Version
+    return Version(version_string)
+
+
+def _version_too_old(installed: str, required: str) -> bool:
+    """True when the installed version is below the required minimum."""
+    return _parse_version(installed) < _parse_version(required)
+
+
+@functools.lru_cache(maxsize=None)
+def _probe(import_name: str, min_version: Optional[str] = None,
+           max_version: Optional[str] = None,
+           dist_name: Optional[str] = None
+           ) -> Tuple[DependencyStatus, Optional[str], Optional[str]]:
+    """Import and version-check a module once per process.
+
+    The result is memoized per (import_name, min_version, max_version), so
+    repeated scans — Streamlit reruns probe features constantly — skip the
+    import machinery and version parsing entirely.
+    """
+    try:
+        # Peek sys.modules first: already-loaded modules (the common case in
+        # a running app) skip the import lock and finder traversal.
+        module = sys.modules.get(import_name)
+        if module is None:
+            module = importlib.import_module(import_name)
+    except ImportError as e:
+        return (DependencyStatus.MISSING, None, f"모듈을 가져올 수 없습니다: {e}")
+    except Exception as e:
+        # Heavy native packages (torch, cv2, mediapipe) can fail at import
+        # with OSError/RuntimeError from their shared libraries; treat any
+        # failure as missing rather than crashing the degraded path.
+        logger.warning("의존성 import 중 오류 (%s): %s", import_name, e)
+        return (DependencyStatus.MISSING, None, f"모듈을 가져올 수 없습니다: {e}")
+    installed = _pkg_version(dist_name or import_name) or _get_module_version(module)
+    if min_version and installed and _version_too_old(installed, min_version):
+        return (
+            DependencyStatus.VERSION_MISMATCH,
+            installed,
+            f"버전이 너무 낮습니다 (현재: {installed}, 필요: {min_version}+)",
+        )
+    if max_version and installed and _version_too_old(max_version, installed):
+        return (
+            DependencyStatus.VERSION_MISMATCH,
+            installed,
+            f"버전이 너무 높습니다 (현재: {installed}, 최대: {max_version})",
+        )
+    return (DependencyStatus.AVAILABLE, installed, None)
+
+
+#: Default dependency tables.  Built once at import; DependencyChecker
+#: shallow-copies each entry so per-instance status fields stay private.
+_CORE_DEPS: Tuple[DependencyInfo, ...] = (
+    DependencyInfo("streamlit", "streamlit", min_version="1.33.0",
+                   description="웹 UI 프레임워크"),
+    DependencyInfo("python-dotenv", "dotenv",
+                   description="환경변수 로딩"),
+    DependencyInfo("openai", "openai", min_version="1.0.0",
+                   description="OpenAI API 클라이언트"),
+    DependencyInfo("packaging", "packaging",
+                   description="버전 비교"),
+)
+_VISION_DEPS: Tuple[DependencyInfo, ...] = (
+    DependencyInfo("torch", "torch", min_version="2.0.0", is_optional=True,
+                   description="로컬 비전 모델 런타임"),
+    DependencyInfo("ultralytics", "ultralytics", min_version="8.0.20",
+                   is_optional=True, description="YOLO 객체 탐지"),
+    DependencyInfo("rembg", "rembg", is_optional=True,
+                   description="배경 제거"),
+    DependencyInfo("opencv-python", "cv2", is_optional=True,
+                   description="이미지 처리"),
+    DependencyInfo("mediapipe", "mediapipe", is_optional=True,
+                   description="경량 비전 파이프라인"),
+    DependencyInfo("Pillow", "PIL", description="이미지 로딩/변환"),
+)
+_WEB_DEPS: Tuple[DependencyInfo, ...] = (
+    DependencyInfo("requests", "requests", min_version="2.28.0",
+                   description="HTTP 클라이언트"),
+    DependencyInfo("beautifulsoup4", "bs4",
+                   description="HTML 파싱"),
+    DependencyInfo("lxml", "lxml", is_optional=True,
+                   description="고속 XML/HTML 파서"),
+)
+
+_DEFAULT_GROUP_TABLES: Tuple[Tuple[str, str, Tuple[DependencyInfo, ...]], ...] = (
+    ("core", "필수 핵심 의존성", _CORE_DEPS),
+    ("vision", "로컬 비전 분석 의존성", _VISION_DEPS),
+    ("web", "웹 수집/파싱 의존성", _WEB_DEPS),
+)
+
+#: Dependency groups each feature needs before it can be enabled.
+_FEATURE_DEPS_MAP: Dict[str, Tuple[str, ...]] = {
+    "vision_analysis": ("vision",),
+    "openai_analysis": ("core",),
+    "district_management": ("web",),
+    "link_collector": ("web",),
+}
+
+
+class DependencyChecker:
+    """Checks the availability of the app's dependency groups."""
+
+    def __init__(self):
+        self.dependency_groups: Dict[str, DependencyGroup] = {
+            name: DependencyGroup(name, description,
+                                  [copy.copy(dep) for dep in deps])
+            for name, description, deps in _DEFAULT_GROUP_TABLES
+        }
+        #: Cached outcome per checked group; valid until invalidate().
+        self._group_checked: Dict[str, bool] = {}
+
+    def check_dependency(self, dep_info: DependencyInfo) -> bool:
+        """Probe a single dependency, updating its fields in place."""
+        status, installed, error = _probe(
+            dep_info.import_name, dep_info.min_version, dep_info.max_version,
+            dist_name=dep_info.name,
+        )
+        dep_info.status = status
+        dep_info.installed_version = installed
+        dep_info.error_message = error
+        if status == DependencyStatus.AVAILABLE:
+            logger.debug("Dependency available: %s (%s)", dep_info.name, installed)
+            return True
+        logger.debug("Dependency problem: %s: %s", dep_info.name, error)
+        return False
+
+    def check_group(self, group_name: str) -> bool:
+        """Check a group; True when every non-optional dependency is available."""
+        group = self.dependency_groups.get(group_name)
+        if group is None:
+            return False
+        ok = True
+        for dep in group.required_deps:
+            if not self.check_dependency(dep):
+                ok = False
+        for dep in group.optional_deps:
+            self.check_dependency(dep)
+        self._group_checked[group_name] = ok
+        return ok
+
+    def check_all_groups(self) -> Dict[str, List[DependencyInfo]]:
+        """Probe every group and return the per-group dependency lists.
+
+        The probes are independent, so cold imports of the heavy optional
+        packages run concurrently; the scan cost approaches the slowest
+        single import instead of the sum of all of them.
+        """
+        all_deps = [
+            dep
+            for group in self.dependency_groups.values()
+            for dep in group.dependencies
+        ]
+        if all_deps:
+            with ThreadPoolExecutor(max_workers=min(8, len(all_deps))) as executor:
+                futures = [
+                    executor.submit(self.check_dependency, dep) for dep in all_deps
+                ]
+                for future in as_completed(futures):
+                    future.result()
+        return {
+            group_name: group.dependencies
+            for group_name, group in self.dependency_groups.items()
+        }
+
+    def get_missing_critical_dependencies(self) -> List[DependencyInfo]:
+        """Return every non-optional dependency that is not available."""
+        missing: List[DependencyInfo] = []
+        for group in self.dependency_groups.values():
+            for dep in group.required_deps:
+                if not self.check_dependency(dep):
+                    missing.append(dep)
+        return missing
+
+    def can_enable_feature(self, feature_name: str) -> bool:
+        """True when every dependency group the feature needs is satisfied."""
+        required_groups = _FEATURE_DEPS_MAP.get(feature_name, ())
+        checked = self._group_checked
+        return all(
+            checked[group] if group in checked else self.check_group(group)
+            for group in required_groups
+        )
+
+    def invalidate(self) -> None:
+        """Drop all cached probe results so the next check re-probes.
+
+        Clears the shared module-level probe caches too, so a package
+        installed mid-session is picked up by every checker.
+        """
+        self._group_checked.clear()
+        _probe.cache_clear()
+        _pkg_version.cache_clear()
+
+    def generate_requirements_txt(self) -> str:
+        """Render the dependency tables as requirements.txt content."""
+        buf = io.StringIO()
+        for group_name, group in self.dependency_groups.items():
+            buf.write(f"# {group_name}: {group.description}\n")
+            for dep in group.dependencies:
+                buf.write(dep.requirement_line)
+                buf.write("\n")
+            buf.write("\n")
+        return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=1)
+def get_dependency_checker() -> DependencyChecker:
+    """Return the process-wide dependency checker with the default tables."""
+    return DependencyChecker()
+
+
+def create_streamlit_dependency_ui(checker: Optional[DependencyChecker] = None) -> None:
+    """Render the dependency status panel.
+
+    Results stream into per-group placeholders as the probes finish, so
+    the page is interactive immediately instead of blocking on the full
+    scan (a cold torch import alone can take seconds).
+    """
+    import streamlit as st
+
+    checker = checker or get_dependency_checker()
+    st.header("📦 의존성 상태")
+    placeholders = {
+        group_name: st.empty() for group_name in checker.dependency_groups
+    }
+    for group_name, placeholder in placeholders.items():
+        placeholder.info(f"🔄 {group_name} 의존성 확인 중...")
+    missing_placeholder = st.empty()
+
+    def _render_group(group_name: str) -> None:
+        group = checker.dependency_groups[group_name]
+        with placeholders[group_name].container():
+            with st.expander(f"{group_name} — {group.description}", expanded=False):
+                for dep in group.dependencies:
+                    if dep.status == DependencyStatus.AVAILABLE:
+                        st.success(f"✅ {dep.name} {dep.installed_version or ''}")
+                    elif dep.is_optional:
+                        st.warning(f"⚠️ {dep.name}: {dep.error_message}")
+                    else:
+                        st.error(f"❌ {dep.name}: {dep.error_message}")
+
+    # Groups that can contribute to the critical-missing banner; the
+    # banner renders as soon as these finish, without waiting for vision.
+    critical_pending = {
+        group_name
+        for group_name, group in checker.dependency_groups.items()
+        if any(not dep.is_optional for dep in group.dependencies)
+    }
+    banner_rendered = False
+    with ThreadPoolExecutor(max_workers=len(placeholders)) as executor:
+        futures = {
+            executor.submit(checker.check_group, group_name): group_name
+            for group_name in checker.dependency_groups
+        }
+        for future in as_completed(futures):
+            group_name = futures[future]
+            future.result()
+            _render_group(group_name)
+            critical_pending.discard(group_name)
+            if not critical_pending and not banner_rendered:
+                banner_rendered = True
+                missing = checker.get_missing_critical_dependencies()
+                if missing:
+                    missing_placeholder.error(
+                        "필수 의존성이 누락되었습니다: "
+                        + ", ".join(d.name for d in missing)
+                    )
@@ -0,0 +1,241 @@
+"""Dependency-aware feature registry.
+
+Features declare the dependency bundles they need (``vision``, ``openai``,
+``web`` or a bare module name); the registry probes those on registration
+and tracks per-feature status and configuration.
+"""
+
+import functools
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.core.dependency_manager import DependencyStatus, _pkg_version, _probe
+
+logger = logging.getLogger(__name__)
+
+
+class FeatureStatus(str, Enum):
+    """Feature states; the str mixin makes members compare as plain strings."""
+
+    UNKNOWN = "unknown"
+    AVAILABLE = "available"
+    ENABLED = "enabled"
+    DISABLED = "disabled"
+    UNAVAILABLE = "unavailable"
+
+
+@dataclass(slots=True)
+class FeatureDescriptor:
+    """Metadata and runtime state for a single feature."""
+
+    name: str
+    display_name: str
+    description: str = ""
+    dependencies: List[str] = field(default_factory=list)
+    config: Dict[str, Any] = field(default_factory=dict)
+    config_schema: Optional[Dict[str, type]] = None
+    status: FeatureStatus = FeatureStatus.UNKNOWN
+    error_message: Optional[str] = None
+    #: Set by the registry at registration; False means config updates can
+    #: skip the validation call entirely.
+    _needs_validation: bool = field(init=False, default=False)
+
+
+#: Module bundles a feature can declare as a single dependency name.
+_DEPENDENCY_BUNDLES: Dict[str, Tuple[str, ...]] = {
+    "vision": ("torch", "ultralytics", "rembg", "cv2", "mediapipe"),
+    "openai": ("openai",),
+    "web": ("requests", "bs4"),
+}
+
+
+class DependencyChecker:
+    """Probes import availability for feature dependency bundles.
+
+    A thin adapter over the shared, memoized probe in dependency_manager,
+    so both checkers touch each heavy module at most once per process.
+    """
+
+    def check_dependencies(self, dependencies: List[str]) -> Dict[str, Tuple[bool, str]]:
+        """Check each named dependency bundle or bare module."""
+        results: Dict[str, Tuple[bool, str]] = {}
+        for dep in dependencies:
+            modules = _DEPENDENCY_BUNDLES.get(dep, (dep,))
+            for module_name in modules:
+                status, _, error = _probe(module_name)
+                if status is not DependencyStatus.AVAILABLE:
+                    results[dep] = (False, error or "")
+                    break
+            else:
+                results[dep] = (True, "")
+        return results
+
+
+class FeatureRegistry:
+    """Registers features and keeps their status in sync with dependencies."""
+
+    def __init__(self, dependency_checker: Optional[DependencyChecker] = None):
+        self._features: Dict[str, FeatureDescriptor] = {}
+        self._validators: Dict[str, Callable[[Dict[str, Any]], bool]] = {}
+        self._dependency_checker = dependency_checker or DependencyChecker()
+        #: Shared per-dependency results; features reuse entries instead of
+        #: re-probing bundles that another feature already resolved.
+        self._dep_status: Dict[str, Tuple[bool, str]] = {}
+
+    def register_feature(self, feature: FeatureDescriptor,
+                         validator: Optional[Callable[[Dict[str, Any]], bool]] = None) -> None:
+        """Register a feature and immediately resolve its availability."""
+        self._features[feature.name] = feature
+        if validator is not None:
+            self._validators[feature.name] = validator
+        feature._needs_validation = (
+            bool(feature.config_schema) or feature.name in self._validators
+        )
+        self._check_and_update_feature_status(feature.name)
+
+    def _check_and_update_feature_status(self, name: str) -> None:
+        feature = self._features[name]
+        unknown = [dep for dep in feature.dependencies if dep not in self._dep_status]
+        if unknown:
+            self._dep_status.update(
+                self._dependency_checker.check_dependencies(unknown)
+            )
+        failed = [
+            dep for dep in feature.dependencies if not self._dep_status[dep][0]
+        ]
+        if failed:
+            feature.status = FeatureStatus.UNAVAILABLE
+            feature.error_message = f"의존성 누락: {', '.join(failed)}"
+        else:
+            feature.status = FeatureStatus.AVAILABLE
+            feature.error_message = None
+
+    def _validate_feature_config(self, feature: FeatureDescriptor,
+                                 config: Dict[str, Any]) -> bool:
+        if feature.config_schema:
+            for key, expected_type in feature.config_schema.items():
+                if key in config and not isinstance(config[key], expected_type):
+                    logger.warning(
+                        "Invalid config for %s: %s expects %s",
+                        feature.name, key, expected_type.__name__,
+                    )
+                    return False
+        validator = self._validators.get(feature.name)
+        if validator is not None and not validator(config):
+            return False
+        return True
+
+    def enable_feature(self, name: str, config: Optional[Dict[str, Any]] = None) -> bool:
+        feature = self._features.get(name)
+        if feature is None or feature.status == FeatureStatus.UNAVAILABLE:
+            return False
+        if config:
+            if feature._needs_validation and not self._validate_feature_config(
+                    feature, config):
+                return False
+            feature.config.update(config)
+        feature.status = FeatureStatus.ENABLED
+        return True
+
+    def disable_feature(self, name: str) -> bool:
+        feature = self._features.get(name)
+        if feature is None:
+            return False
+        feature.status = FeatureStatus.DISABLED
+        return True
+
+    def update_feature_config(self, name: str, config: Dict[str, Any]) -> bool:
+        feature = self._features.get(name)
+        if feature is None:
+            return False
+        if (config and feature._needs_validation
+                and not self._validate_feature_config(feature, config)):
+            return False
+        feature.config.update(config)
+        return True
+
+    def is_feature_available(self, name: str) -> bool:
+        feature = self._features.get(name)
+        return feature is not None and feature.status in (
+            FeatureStatus.AVAILABLE, FeatureStatus.ENABLED
+        )
+
+    def is_feature_enabled(self, name: str) -> bool:
+        feature = self._features.get(name)
+        return feature is not None and feature.status == FeatureStatus.ENABLED
+
+    def get_feature(self, name: str) -> Optional[FeatureDescriptor]:
+        return self._features.get(name)
+
+    def list_features(self) -> List[str]:
+        return list(self._features.keys())
+
+    def refresh_feature_status(self) -> None:
+        """Re-probe dependencies for every registered feature.
+
+        Clears the shared probe caches first: without that, a package
+        installed (or broken) mid-session would keep being served from
+        the warm memo and a refresh would change nothing.
+        """
+        _probe.cache_clear()
+        _pkg_version.cache_clear()
+        self._dep_status.clear()
+        all_deps = {
+            dep for feature in self._features.values() for dep in feature.dependencies
+        }
+        if all_deps:
+            self._dep_status.update(
+                self._dependency_checker.check_dependencies(sorted(all_deps))
+            )
+        for name in self._features:
+            self._check_and_update_feature_status(name)
+
+
+def create_default_feature_registry() -> FeatureRegistry:
+    """Build the registry with the application's standard feature set.
+
+    Features are registered cheapest-first so the light ones are usable
+    before any heavy probe runs, and the full dependency union is probed
+    once upfront so per-feature registration hits the warm cache.
+    """
+    registry = FeatureRegistry()
+    registry._dependency_checker.check_dependencies(["web", "openai", "vision"])
+    registry.register_feature(FeatureDescriptor(
+        name="tunnel_management",
+        display_name="터널 관리",
+        description="개발용 외부 접속 터널 관리",
+    ))
+    registry.register_feature(FeatureDescriptor(
+        name="district_management",
+        display_name="지자체 관리",
+        description="지자체 분리배출 정보 관리",
+        dependencies=["web"],
+    ))
+    registry.register_feature(FeatureDescriptor(
+        name="link_collector",
+        display_name="링크 수집기",
+        description="지자체별 안내 링크 수집",
+        dependencies=["web"],
+    ))
+    registry.register_feature(FeatureDescriptor(
+        name="openai_analysis",
+        display_name="OpenAI 분석",
+        description="OpenAI 비전 모델 기반 분석",
+        dependencies=["openai"],
+        config_schema={"model": str, "max_tokens": int},
+    ))
+    registry.register_feature(FeatureDescriptor(
+        name="vision_analysis",
+        display_name="로컬 비전 분석",
+        description="로컬 모델 기반 폐기물 이미지 분석",
+        dependencies=["vision"],
+    ))
+    return registry
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_feature_registry() -> FeatureRegistry:
+    """Process-wide default registry; reruns reuse one probed instance."""
+    return create_default_feature_registry()
@@ -0,0 +1,654 @@
+"""Prompt feature registry and manager.
+
+Prompt features are the analysis building blocks (waste analysis, recycling
+guide, ...) that can be toggled per deployment.  The registry persists the
+feature catalogue under ``config/prompt_features/``; the manager layers
+per-feature configuration and activation logic on top.
+"""
+
+import copy
+import functools
+import json
+import logging
+import os
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_REGISTRY_VERSION = "1.0"
+
+#: Features every deployment starts with; registered on first load.
+_DEFAULT_FEATURES: Tuple[Dict[str, Any], ...] = (
+    {
+        "feature_id": "waste_analysis",
+        "name": "폐기물 분석",
+        "description": "이미지에서 폐기물 종류와 배출 방법을 분석",
+        "category": "analysis",
+        "required_services": ["openai_service"],
+    },
+    {
+        "feature_id": "recycling_guide",
+        "name": "재활용 가이드",
+        "description": "분석 결과 기반 재활용 안내 생성",
+        "category": "analysis",
+        "required_services": ["openai_service"],
+    },
+    {
+        "feature_id": "image_quality_check",
+        "name": "이미지 품질 확인",
+        "description": "업로드 이미지의 분석 적합성 검사",
+        "category": "input",
+        "required_services": [],
+    },
+    {
+        "feature_id": "location_context",
+        "name": "지역 컨텍스트",
+        "description": "사용자 지역의 배출 규정을 프롬프트에 반영",
+        "category": "context",
+        "required_services": [],
+    },
+    {
+        "feature_id": "feedback_prompt",
+        "name": "피드백 프롬프트",
+        "description": "분석 결과에 대한 사용자 피드백 수집",
+        "category": "interaction",
+        "required_services": [],
+    },
+)
+
+
+@dataclass
+class PromptFeatureInfo:
+    """Catalogue entry for a single prompt feature."""
+
+    feature_id: str
+    name: str
+    description: str = ""
+    category: str = "general"
+    is_active: bool = False
+    required_services: Tuple[str, ...] = ()
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    #: True for features registered in this process (not loaded from disk);
+    #: runtime-only state, excluded from to_dict.
+    registered_at_runtime: bool = False
+
+    def __post_init__(self):
+        # Categories and service names repeat across every feature;
+        # interning shares one str object per distinct value and makes
+        # the category comparisons in the index paths pointer-equality.
+        self.category = sys.intern(self.category)
+        self.required_services = tuple(
+            sys.intern(s) for s in self.required_services
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat JSON-ready dict; shares field references instead of the
+        deep recursive copy dataclasses.asdict performs."""
+        return {
+            "feature_id": self.feature_id,
+            "name": self.name,
+            "description": self.description,
+            "category": self.category,
+            "is_active": self.is_active,
+            "required_services": list(self.required_services),
+            "metadata": self.metadata,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json_file(path_str: str, mtime: float) -> Dict[str, Any]:
+    """Parse a JSON config file, memoized on (path, mtime).
+
+    Re-instantiating a registry or manager in the same process reuses the
+    parsed dict instead of re-reading and re-parsing from disk; a real
+    change on disk bumps the mtime and misses the cache naturally.
+    """
+    with open(path_str, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize config payloads, preferring orjson's C encoder.
+
+    The payloads are Korean-text heavy; orjson encodes them several times
+    faster than the stdlib and returns UTF-8 bytes directly.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    """Write via a sibling temp file and an atomic rename.
+
+    Readers never observe a partially-written config, and a crash
+    mid-write leaves the previous file intact.  A failed write cleans up
+    its temp file before re-raising.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _read_config_file(path: Path) -> Optional[Dict[str, Any]]:
+    """Load a JSON config file through the mtime-keyed cache.
+
+    Returns a deep copy: callers mutate nested dicts (feature configs,
+    metadata) in place, and sharing those with the cache entry would
+    corrupt what later readers see for the same (path, mtime) key.
+    """
+    try:
+        return copy.deepcopy(_load_json_file(str(path), path.stat().st_mtime))
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error("설정 파일을 읽을 수 없습니다 (%s): %s", path, e)
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _display_info(feature_id: str, name: str, description: str, category: str,
+                  is_active: bool, services: Tuple[str, ...]) -> Dict[str, Any]:
+    """Build (and memoize) the admin-UI payload for one feature state.
+
+    Keyed on every field that feeds the payload, so no explicit
+    invalidation is needed — a changed feature simply misses the cache.
+    """
+    return {
+        "feature_id": feature_id,
+        "name": name,
+        "description": description,
+        "category": category,
+        "status_label": "활성" if is_active else "비활성",
+        "services": ", ".join(services) or "없음",
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _missing_services(required: Tuple[str, ...],
+                      available: frozenset) -> Tuple[str, ...]:
+    """Memoized missing-service computation for one (required, available) pair."""
+    return tuple(service for service in required if service not in available)
+
+
+class PromptFeatureRegistry:
+    """Persistent catalogue of the available prompt features."""
+
+    def __init__(self, config_dir: Optional[Path] = None):
+        self.config_path = Path(config_dir) if config_dir else Path(
+            "config/prompt_features"
+        )
+        self.config_file = self.config_path / "features.json"
+        self._features: Dict[str, PromptFeatureInfo] = {}
+        #: service/feature id -> ids of features that require it.
+        self._reverse_deps: Dict[str, Set[str]] = {}
+        #: Query indexes rebuilt on mutation so reads never re-sort.
+        self._sorted_ids: List[str] = []
+        self._by_category: Dict[str, List[str]] = {}
+        self._config_hash: Optional[int] = None
+        self._defer_save = False
+        self._save_pending = False
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        """Perform the deferred disk I/O on first real use.
+
+        Construction stays free of syscalls so importing code paths that
+        never touch the registry pay nothing.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+        # After the first run the directory exists; one stat beats an
+        # unconditional mkdir syscall per process.
+        if not self.config_path.exists():
+            self.config_path.mkdir(parents=True, exist_ok=True)
+        self._load_features()
+        self._register_default_features()
+        self._rebuild_indexes()
+
+    # -- persistence ----------------------------------------------------
+
+    def _load_features(self) -> None:
+        data = _read_config_file(self.config_file)
+        if data is None:
+            return
+        for entry in data.get("features", []):
+            entry = dict(entry)
+            for key in ("created_at", "updated_at"):
+                if isinstance(entry.get(key), str):
+                    entry[key] = datetime.fromisoformat(entry[key])
+            feature = PromptFeatureInfo(**entry)
+            self._features[feature.feature_id] = feature
+            self._index_dependencies(feature)
+
+    def _rebuild_indexes(self) -> None:
+        self._sorted_ids = sorted(self._features)
+        by_category: Dict[str, List[str]] = {}
+        for feature_id in self._sorted_ids:
+            by_category.setdefault(
+                self._features[feature_id].category, []
+            ).append(feature_id)
+        self._by_category = by_category
+
+    def _index_dependencies(self, feature: PromptFeatureInfo) -> None:
+        for service in feature.required_services:
+            self._reverse_deps.setdefault(service, set()).add(feature.feature_id)
+
+    def _unindex_dependencies(self, feature: PromptFeatureInfo) -> None:
+        for service in feature.required_services:
+            dependents = self._reverse_deps.get(service)
+            if dependents is not None:
+                dependents.discard(feature.feature_id)
+
+    @contextmanager
+    def batched_saves(self):
+        """Coalesce every save inside the block into one final write."""
+        self._defer_save = True
+        try:
+            yield self
+        finally:
+            self._defer_save = False
+            if self._save_pending:
+                self._save_pending = False
+                self._save_features()
+
+    def _save_features(self) -> bool:
+        if self._defer_save:
+            self._save_pending = True
+            return True
+        data: Dict[str, Any] = {
+            "version": _REGISTRY_VERSION,
+            "updated_at": datetime.now().isoformat(),
+            "features": [],
+        }
+        for feature in self._features.values():
+            data["features"].append(feature.to_dict())
+        # The payload timestamp changes every call; hash only the feature
+        # content so an unchanged catalogue skips the disk write entirely.
+        content_hash = hash(_dump_json_bytes(data["features"]))
+        if content_hash == self._config_hash:
+            return True
+        try:
+            _atomic_write(self.config_file, _dump_json_bytes(data))
+        except OSError as e:
+            logger.error("기능 목록을 저장할 수 없습니다: %s", e)
+            return False
+        self._config_hash = content_hash
+        return True
+
+    def _register_default_features(self) -> None:
+        added_any = False
+        for spec in _DEFAULT_FEATURES:
+            if spec["feature_id"] in self._features:
+                continue
+            self.register_feature(auto_save=False, **spec)
+            added_any = True
+        # An unchanged catalogue (the normal restart case) costs no
+        # serialization and no disk write at all.
+        if added_any:
+            self._save_features()
+
+    # -- mutations ------------------------------------------------------
+
+    def register_feature(self, feature_id: str, name: str, description: str = "",
+                         category: str = "general", is_active: bool = False,
+                         required_services: Optional[List[str]] = None,
+                         metadata: Optional[Dict[str, Any]] = None,
+                         auto_save: bool = True) -> PromptFeatureInfo:
+        """Register or update a feature; existing entries keep their state."""
+        self._ensure_loaded()
+        existing = self._features.get(feature_id)
+        if existing is not None:
+            feature = existing
+            feature.name = name
+            feature.description = description
+            feature.category = category
+            feature.updated_at = datetime.now()
+        else:
+            feature = PromptFeatureInfo(
+                feature_id=feature_id,
+                name=name,
+                description=description,
+                category=category,
+                is_active=is_active,
+                required_services=tuple(required_services or ()),
+                metadata=dict(metadata or {}),
+            )
+            feature.registered_at_runtime = True
+            self._features[feature_id] = feature
+            self._index_dependencies(feature)
+        self._rebuild_indexes()
+        if auto_save:
+            self._save_features()
+        return feature
+
+    def unregister_feature(self, feature_id: str) -> bool:
+        self._ensure_loaded()
+        feature = self._features.get(feature_id)
+        if feature is None:
+            return False
+        del self._features[feature_id]
+        self._unindex_dependencies(feature)
+        self._rebuild_indexes()
+        self._save_features()
+        return True
+
+    def update_feature_status(self, feature_id: str, is_active: bool,
+                              auto_save: bool = True) -> bool:
+        self._ensure_loaded()
+        feature = self._features.get(feature_id)
+        if feature is None:
+            return False
+        if feature.is_active == is_active:
+            return True
+        feature.is_active = is_active
+        feature.updated_at = datetime.now()
+        if auto_save:
+            self._save_features()
+        return True
+
+    # -- queries --------------------------------------------------------
+
+    def get_feature(self, feature_id: str) -> Optional[PromptFeatureInfo]:
+        self._ensure_loaded()
+        return self._features.get(feature_id)
+
+    def list_features(self, active_only: bool = False,
+                      category: Optional[str] = None) -> List[PromptFeatureInfo]:
+        self._ensure_loaded()
+        if category is not None:
+            ids = self._by_category.get(category, [])
+        else:
+            ids = self._sorted_ids
+        features = [self._features[feature_id] for feature_id in ids]
+        if active_only:
+            features = [f for f in features if f.is_active]
+        return features
+
+    def get_feature_ids(self) -> List[str]:
+        return [f.feature_id for f in self.list_features()]
+
+    def get_categories(self) -> List[str]:
+        self._ensure_loaded()
+        return sorted(self._by_category)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        self._ensure_loaded()
+        active = 0
+        runtime = 0
+        category_counts: Counter = Counter()
+        for feature in self._features.values():
+            if feature.is_active:
+                active += 1
+            if feature.registered_at_runtime:
+                runtime += 1
+            category_counts[feature.category] += 1
+        total = len(self._features)
+        return {
+            "total_features": total,
+            "active_features": active,
+            "inactive_features": total - active,
+            "total_categories": len(category_counts),
+            "category_distribution": dict(category_counts),
+            "runtime_registered": runtime,
+        }
+
+    def get_feature_display_info(self, feature_id: str) -> Optional[Dict[str, Any]]:
+        """Presentation payload for the admin UI."""
+        self._ensure_loaded()
+        feature = self._features.get(feature_id)
+        if feature is None:
+            return None
+        return _display_info(
+            feature.feature_id, feature.name, feature.description,
+            feature.category, feature.is_active, feature.required_services,
+        )
+
+    def validate_feature_dependencies(self, feature_id: str,
+                                      available_services: Set[str]) -> List[str]:
+        """Return the required services that are not currently available."""
+        self._ensure_loaded()
+        feature = self._features.get(feature_id)
+        if feature is None:
+            return []
+        return list(
+            _missing_services(feature.required_services,
+                              frozenset(available_services))
+        )
+
+
+class PromptFeatureManager:
+    """Activation and per-feature configuration on top of the registry."""
+
+    def __init__(self, registry: Optional[PromptFeatureRegistry] = None):
+        self.registry = registry or get_prompt_feature_registry()
+        self.config_path = self.registry.config_path
+        self.config_file = self.config_path / "feature_configs.json"
+        self._config_hash: Optional[int] = None
+        self._defer_save = False
+        self._save_pending = False
+        self._feature_configs: Dict[str, Dict[str, Any]] = {}
+        #: Validation results per available-services set; dropped whenever
+        #: an activation or config change could alter the outcome.
+        self._validation_cache: Dict[frozenset, Dict[str, List[str]]] = {}
+        #: Read-only views handed out by get_feature_config; rebuilt per
+        #: key when that feature's config changes.
+        self._readonly_configs: Dict[str, Mapping[str, Any]] = {}
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        """Read the config file on first real use, not at construction."""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._feature_configs = self._load_configurations()
+
+    # -- persistence ----------------------------------------------------
+
+    def _load_configurations(self) -> Dict[str, Dict[str, Any]]:
+        data = _read_config_file(self.config_file)
+        if data is None:
+            return {}
+        return dict(data.get("configs", {}))
+
+    @contextmanager
+    def batched_saves(self):
+        """Coalesce every save inside the block into one final write."""
+        self._defer_save = True
+        try:
+            yield self
+        finally:
+            self._defer_save = False
+            if self._save_pending:
+                self._save_pending = False
+                self._save_feature_configs()
+
+    def _save_feature_configs(self) -> bool:
+        if self._defer_save:
+            self._save_pending = True
+            return True
+        content = _dump_json_bytes({"configs": self._feature_configs})
+        content_hash = hash(content)
+        if content_hash == self._config_hash:
+            return True
+        try:
+            _atomic_write(self.config_file, content)
+        except OSError as e:
+            logger.error("기능 설정을 저장할 수 없습니다: %s", e)
+            return False
+        self._config_hash = content_hash
+        return True
+
+    # -- activation -----------------------------------------------------
+
+    def activate_feature(self, feature_id: str,
+                         custom_config: Optional[Dict[str, Any]] = None) -> bool:
+        self._ensure_loaded()
+        feature = self.registry.get_feature(feature_id)
+        if feature is None:
+            logger.warning("알 수 없는 기능입니다: %s", feature_id)
+            return False
+        if feature.is_active and not custom_config:
+            return True
+        if not self.registry.update_feature_status(feature_id, True):
+            return False
+        if custom_config:
+            self._feature_configs.setdefault(feature_id, {}).update(custom_config)
+            self._readonly_configs.pop(feature_id, None)
+        self._validation_cache.clear()
+        self._save_feature_configs()
+        return True
+
+    def deactivate_feature(self, feature_id: str, force: bool = False) -> bool:
+        self._ensure_loaded()
+        dependents = self._get_dependent_features(feature_id)
+        if dependents and not force:
+            logger.warning(
+                "다른 기능이 의존 중이므로 비활성화할 수 없습니다: %s <- %s",
+                feature_id, dependents,
+            )
+            return False
+        if not self.registry.update_feature_status(feature_id, False):
+            return False
+        self._validation_cache.clear()
+        self._save_feature_configs()
+        return True
+
+    def _get_dependent_features(self, feature_id: str) -> List[str]:
+        """Features whose required_services include the given feature."""
+        # The index is only populated once the registry has loaded; on a
+        # cold registry an empty dict would silently bypass the guard.
+        self.registry._ensure_loaded()
+        dependents = self.registry._reverse_deps.get(feature_id, ())
+        return sorted(d for d in dependents if d != feature_id)
+
+    # -- configuration --------------------------------------------------
+
+    def get_feature_config(self, feature_id: str) -> Mapping[str, Any]:
+        """Read-only view of a feature's config; copy it before mutating."""
+        self._ensure_loaded()
+        view = self._readonly_configs.get(feature_id)
+        if view is None:
+            view = MappingProxyType(self._feature_configs.get(feature_id, {}))
+            self._readonly_configs[feature_id] = view
+        return view
+
+    def update_feature_config(self, feature_id: str,
+                              config_updates: Dict[str, Any]) -> bool:
+        self._ensure_loaded()
+        if self.registry.get_feature(feature_id) is None:
+            return False
+        existing = self._feature_configs.get(feature_id, {})
+        merged = {**existing, **config_updates}
+        if merged == existing:
+            return True
+        self._feature_configs[feature_id] = merged
+        self._readonly_configs.pop(feature_id, None)
+        self._validation_cache.clear()
+        self._save_feature_configs()
+        return True
+
+    # -- health ---------------------------------------------------------
+
+    def validate_all_features(self,
+                              available_services: Optional[Set[str]] = None
+                              ) -> Dict[str, List[str]]:
+        """Missing dependencies per feature; empty list means healthy.
+
+        Results are cached per available-services set until the next
+        mutation, so dashboards and health probes re-read for free.
+        """
+        services = available_services or set()
+        cache_key = frozenset(services)
+        cached = self._validation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        problems: Dict[str, List[str]] = {}
+        for feature in self.registry.list_features():
+            missing = self.registry.validate_feature_dependencies(
+                feature.feature_id, services
+            )
+            problems[feature.feature_id] = missing
+        self._validation_cache[cache_key] = problems
+        return problems
+
+    def get_health_report(self,
+                          available_services: Optional[Set[str]] = None
+                          ) -> Dict[str, Any]:
+        problems = self.validate_all_features(available_services)
+        unhealthy = {fid: missing for fid, missing in problems.items() if missing}
+        return {
+            "statistics": self.registry.get_statistics(),
+            "unhealthy_features": unhealthy,
+            "healthy": not unhealthy,
+        }
+
+    def initialize_default_features(self,
+                                    available_services: Optional[Set[str]] = None
+                                    ) -> None:
+        """Activate every default feature that has no missing dependency.
+
+        Features whose required services are not in ``available_services``
+        are skipped.  The per-feature activations share one registry write
+        and one config write instead of rewriting both files per feature.
+        """
+        services = available_services or set()
+        with self.registry.batched_saves(), self.batched_saves():
+            for feature in self.registry.list_features():
+                if feature.is_active:
+                    continue
+                missing = self.registry.validate_feature_dependencies(
+                    feature.feature_id, services
+                )
+                if missing:
+                    logger.info(
+                        "의존 서비스가 없어 기능을 건너뜁니다: %s (누락: %s)",
+                        feature.feature_id, missing,
+                    )
+                    continue
+                self.activate_feature(feature.feature_id)
+
+
+_registry: Optional[PromptFeatureRegistry] = None
+_manager: Optional[PromptFeatureManager] = None
+
+
+def get_prompt_feature_registry() -> PromptFeatureRegistry:
+    """Return the global prompt feature registry."""
+    global _registry
+    if _registry is None:
+        _registry = PromptFeatureRegistry()
+    return _registry
+
+
+def get_prompt_feature_manager() -> PromptFeatureManager:
+    """Return the global prompt feature manager."""
+    global _manager
+    if _manager is None:
+        _manager = PromptFeatureManager()
+    return _manager
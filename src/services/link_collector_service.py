@@ -0,0 +1,106 @@
+"""Service helpers for the district link collector.
+
+Reads the nationwide district table and manages the guidance-page links
+that editors register for each sigungu.  Links live in a flat JSON file
+keyed by ``"시도명_시군구명"``.
+"""
+
+import functools
+import json
+import logging
+import urllib.parse
+from pathlib import Path
+from typing import Any, Dict, List
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+_DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+_DISTRICTS_FILE = _DATA_DIR / "districts.json"
+_LINKS_FILE = _DATA_DIR / "registered_links.json"
+
+
+@st.cache_data(ttl=3600)
+def get_districts_data() -> List[Dict[str, Any]]:
+    """Load the nationwide district table (시도명/시군구명 rows).
+
+    Pure read of a file that changes rarely; cached for an hour so
+    reruns do not re-read and re-parse it.
+    """
+    try:
+        return json.loads(_DISTRICTS_FILE.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        logger.warning("지역 데이터 파일이 없습니다: %s", _DISTRICTS_FILE)
+        return []
+    except (OSError, ValueError) as e:
+        logger.error("지역 데이터를 읽을 수 없습니다: %s", e)
+        return []
+
+
+@st.cache_data(ttl=3600)
+def get_districts_by_key() -> Dict[str, Dict[str, Any]]:
+    """District rows indexed by ``"시도명_시군구명"`` for O(1) lookup."""
+    return {
+        f"{d.get('시도명')}_{d.get('시군구명')}": d
+        for d in get_districts_data()
+    }
+
+
+@st.cache_data(ttl=60)
+def load_registered_links() -> Dict[str, Dict[str, Any]]:
+    """Registered link entries keyed by ``"시도명_시군구명"``."""
+    try:
+        return json.loads(_LINKS_FILE.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.error("등록된 링크를 읽을 수 없습니다: %s", e)
+        return {}
+
+
+def save_link(district_key: str, link_data: Dict[str, Any]) -> bool:
+    """Create or update the link entry for one district."""
+    links = dict(load_registered_links())
+    links[district_key] = link_data
+    if not _write_links(links):
+        return False
+    # The cached copy is stale after a mutation; drop it so the next
+    # rerun re-reads the file.
+    load_registered_links.clear()
+    return True
+
+
+def delete_link(district_key: str) -> bool:
+    """Remove the link entry for one district."""
+    links = dict(load_registered_links())
+    if district_key not in links:
+        return False
+    del links[district_key]
+    if not _write_links(links):
+        return False
+    load_registered_links.clear()
+    return True
+
+
+def _write_links(links: Dict[str, Any]) -> bool:
+    try:
+        _DATA_DIR.mkdir(parents=True, exist_ok=True)
+        _LINKS_FILE.write_text(
+            json.dumps(links, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+    except OSError as e:
+        logger.error("링크를 저장할 수 없습니다: %s", e)
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=512)
+def create_google_search_url(region: str, district: str) -> str:
+    """Google search URL for a district's waste-disposal guidance page.
+
+    Percent-encoding the multibyte Korean query is not free and the URL
+    depends only on (region, district), so results are memoized.
+    """
+    query = urllib.parse.quote(f"{region} {district} 쓰레기 배출 안내")
+    return f"https://www.google.com/search?q={query}"
@@ -0,0 +1,61 @@
+"""OpenAI-backed image analysis service."""
+
+import base64
+from typing import Any, Dict, Optional
+
+from src.app.core.base_service import ConfigurableService
+
+DEFAULT_ANALYSIS_PROMPT = (
+    "이 사진에 있는 폐기물의 종류를 분류하고, 올바른 분리배출 방법을 "
+    "JSON 형식으로 설명해 주세요."
+)
+
+
+class OpenAIService(ConfigurableService):
+    """Wraps the OpenAI chat-completions API for vision analysis."""
+
+    __slots__ = ("_client",)
+
+    def get_service_name(self) -> str:
+        return "openai_service"
+
+    def _initialize(self) -> None:
+        if not self.config.openai.api_key:
+            raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다")
+        from openai import OpenAI
+        self._client = OpenAI(api_key=self.config.openai.api_key)
+
+    def _perform_health_checks(self) -> Dict[str, Any]:
+        return {"model": self.config.openai.model}
+
+    def analyze_image(self, image_bytes: bytes,
+                      prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Send an image to the vision model and return the parsed response."""
+        encoded = base64.b64encode(image_bytes).decode("ascii")
+        response = self._client.chat.completions.create(
+            model=self.config.openai.model,
+            max_tokens=self.config.openai.max_tokens,
+            temperature=self.config.openai.temperature,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt or DEFAULT_ANALYSIS_PROMPT},
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/jpeg;base64,{encoded}"
+                            },
+                        },
+                    ],
+                }
+            ],
+        )
+        return {
+            "content": response.choices[0].message.content,
+            "model": response.model,
+            "usage": {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "completion_tokens": response.usage.completion_tokens,
+            },
+        }
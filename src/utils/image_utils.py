@@ -0,0 +1,26 @@
+"""Image preprocessing helpers for the analysis pipeline."""
+
+import io
+
+from PIL import Image
+
+
+def jpeg_bytes_from_image(image_bytes: bytes, max_size: int = 1024,
+                          quality: int = 85) -> memoryview:
+    """Normalize arbitrary input bytes into a bounded-size JPEG.
+
+    Camera and gallery inputs arrive in varying formats and resolutions;
+    the OpenAI vision API neither needs nor benefits from full-resolution
+    uploads, so downscale to ``max_size`` on the long edge.
+
+    Returns a zero-copy view of the encoder buffer; downstream consumers
+    (base64 encoding) accept any bytes-like object, so the JPEG is never
+    duplicated into a standalone bytes object.
+    """
+    image = Image.open(io.BytesIO(image_bytes))
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    image.thumbnail((max_size, max_size))
+    buf = io.BytesIO()
+    image.save(buf, format="JPEG", quality=quality)
+    return buf.getbuffer()
@@ -0,0 +1,348 @@
+"""Typed access to Streamlit session state.
+
+Raw ``st.session_state`` keys are easy to typo and hard to discover, so
+every page goes through ``SessionStateManager``: the ``init_*`` helpers
+seed defaults and hand back read-through views, and the mutation helpers
+keep related keys consistent.  The user's saved location additionally persists
+to ``uploads/user_location.json`` across sessions.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+#: Rerun entry point, resolved once; older Streamlit releases only ship
+#: experimental_rerun, and very old ones ship neither.
+_rerun = getattr(st, "rerun", None) or getattr(st, "experimental_rerun", None)
+
+_LOCATION_FILE_NAME = "user_location.json"
+
+#: Digest of the location last written to disk (saved_at excluded), used
+#: to skip the write when the user re-saves an unchanged location.
+_last_saved_digest: Optional[bytes] = None
+
+#: Cached result of the saved-location existence check.  The file only
+#: changes through this module, so the stat() per rerun is redundant;
+#: None means "not checked yet this process".
+_saved_location_file_exists: Optional[bool] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _uploads_dir_cached() -> Path:
+    """Resolve the uploads directory once per process.
+
+    The path never changes at runtime, so the resolve() syscall chain
+    runs a single time instead of on every location read or write.
+    """
+    return Path(__file__).resolve().parents[2] / "uploads"
+
+
+#: Default values per state group; also the attribute set its view exposes.
+_IMAGE_DEFAULTS: Dict[str, Any] = {
+    "camera_photo_bytes": None,
+    "gallery_photo_bytes": None,
+    "analysis_result": None,
+    "analysis_error": None,
+    "active_tab": "📷 카메라",
+}
+
+_UI_DEFAULTS: Dict[str, Any] = {
+    "show_analysis_details": False,
+    "pending_tab_switch": None,
+    "last_action": None,
+}
+
+_LOCATION_DEFAULTS: Dict[str, Any] = {
+    "current_location": None,
+    "selected_sido": None,
+    "selected_sigungu": None,
+    "location_method": "manual",
+    "latitude": None,
+    "longitude": None,
+    "location_confirmed": False,
+    "location_error": None,
+    "last_location_update": None,
+    "saved_user_location": None,
+}
+
+
+class _SessionStateView:
+    """Allocation-free read-through view over st.session_state.
+
+    Reruns previously built a fresh snapshot dataclass per call; a view
+    reads each attribute straight from session state on access, so
+    nothing is copied and stale snapshots cannot occur.
+    """
+
+    __slots__ = ("_defaults",)
+
+    def __init__(self, defaults: Dict[str, Any]):
+        self._defaults = defaults
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            default = self._defaults[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return st.session_state.get(name, default)
+
+
+_IMAGE_VIEW = _SessionStateView(_IMAGE_DEFAULTS)
+_UI_VIEW = _SessionStateView(_UI_DEFAULTS)
+_LOCATION_VIEW = _SessionStateView(_LOCATION_DEFAULTS)
+
+#: Display labels for the location-selection method, keyed by method id.
+_METHOD_DISPLAY: Dict[str, str] = {
+    "manual": "직접 선택",
+    "gps": "GPS",
+    "saved": "저장된 위치",
+}
+
+
+class SessionStateManager:
+    """Central helper for reading and mutating Streamlit session state."""
+
+    #: Session key holding the image for each input tab.
+    _TAB_KEY_MAP = {
+        "📷 카메라": "camera_photo_bytes",
+        "🖼️ 갤러리": "gallery_photo_bytes",
+    }
+
+    # -- initialization -------------------------------------------------
+
+    @classmethod
+    def init_image_state(cls) -> _SessionStateView:
+        # setdefault seeds missing keys in one lookup each; the shared
+        # view is returned as-is, so no object is allocated per rerun.
+        ss = st.session_state
+        for key, default in _IMAGE_DEFAULTS.items():
+            ss.setdefault(key, default)
+        return _IMAGE_VIEW
+
+    @classmethod
+    def init_ui_state(cls) -> _SessionStateView:
+        ss = st.session_state
+        for key, default in _UI_DEFAULTS.items():
+            ss.setdefault(key, default)
+        return _UI_VIEW
+
+    @classmethod
+    def init_location_state(cls) -> _SessionStateView:
+        ss = st.session_state
+        for key, default in _LOCATION_DEFAULTS.items():
+            ss.setdefault(key, default)
+        return _LOCATION_VIEW
+
+    @classmethod
+    def get_image_state(cls) -> _SessionStateView:
+        return cls.init_image_state()
+
+    @classmethod
+    def get_ui_state(cls) -> _SessionStateView:
+        return cls.init_ui_state()
+
+    @classmethod
+    def get_location_state(cls) -> _SessionStateView:
+        return cls.init_location_state()
+
+    # -- image state ----------------------------------------------------
+
+    @classmethod
+    def update_image_bytes(cls, source: str, data: Optional[bytes]) -> None:
+        """Store captured image bytes for the camera or gallery tab."""
+        key = "camera_photo_bytes" if source == "camera" else "gallery_photo_bytes"
+        st.session_state.update({
+            key: data,
+            "analysis_result": None,
+            "analysis_error": None,
+        })
+
+    @classmethod
+    def clear_image_data(cls) -> None:
+        # One update() call instead of one proxy __setitem__ per key.
+        st.session_state.update({
+            "camera_photo_bytes": None,
+            "gallery_photo_bytes": None,
+            "analysis_result": None,
+            "analysis_error": None,
+        })
+
+    @classmethod
+    def get_selected_image_bytes(cls, tab_selector: str) -> Optional[bytes]:
+        """Image bytes for the currently selected input tab."""
+        key = cls._TAB_KEY_MAP.get(tab_selector)
+        return st.session_state.get(key) if key else None
+
+    @classmethod
+    def handle_tab_switch(cls, target_tab: str) -> None:
+        """Switch the active input tab and rerun the script."""
+        st.session_state.active_tab = target_tab
+        if _rerun is not None:
+            _rerun()
+        else:
+            st.session_state.pending_tab_switch = target_tab
+
+    # -- location state -------------------------------------------------
+
+    @classmethod
+    def update_location_info(cls, location_data: Dict[str, Any]) -> None:
+        """Apply a confirmed location selection to every related key."""
+        st.session_state.update({
+            "current_location": location_data,
+            "selected_sido": location_data.get("sido"),
+            "selected_sigungu": location_data.get("sigungu"),
+            "location_method": location_data.get("method", "manual"),
+            "latitude": location_data.get("latitude"),
+            "longitude": location_data.get("longitude"),
+            "location_confirmed": True,
+            "location_error": None,
+            "last_location_update": datetime.now().isoformat(),
+        })
+
+    @classmethod
+    def clear_location_info(cls) -> None:
+        # Everything except saved_user_location, which survives a reset.
+        st.session_state.update({
+            "current_location": None,
+            "selected_sido": None,
+            "selected_sigungu": None,
+            "location_method": "manual",
+            "latitude": None,
+            "longitude": None,
+            "location_confirmed": False,
+            "location_error": None,
+            "last_location_update": None,
+        })
+
+    @classmethod
+    def is_location_selected(cls) -> bool:
+        # Read-only query: skip the init loop and go straight to the key.
+        return bool(st.session_state.get("current_location"))
+
+    @classmethod
+    def get_current_location_summary(cls) -> Optional[str]:
+        """Human-readable one-liner for the selected location, or None."""
+        ss = st.session_state
+        if not ss.get("current_location"):
+            return None
+        location_method = ss.get("location_method", "manual")
+        method = _METHOD_DISPLAY.get(location_method, location_method)
+        sido = ss.get("selected_sido") or ""
+        sigungu = ss.get("selected_sigungu") or ""
+        return f"{sido} {sigungu} ({method})".strip()
+
+    # -- persistence ----------------------------------------------------
+
+    @classmethod
+    def persist_user_location(cls, location_data: Dict[str, Any]) -> bool:
+        """Save the selected location to disk for the next session."""
+        global _last_saved_digest, _saved_location_file_exists
+
+        saved_location = {
+            **location_data,
+            "saved_at": datetime.now().isoformat(),
+        }
+        # Hash the location itself (not saved_at, which changes every
+        # call) so re-saving an unchanged location skips the disk write.
+        key_bytes = json.dumps(
+            location_data, ensure_ascii=False, sort_keys=True
+        ).encode("utf-8")
+        digest = hashlib.blake2b(key_bytes, digest_size=8).digest()
+        if digest == _last_saved_digest and _saved_location_file_exists:
+            st.session_state.saved_user_location = saved_location
+            return True
+
+        if orjson is not None:
+            payload = orjson.dumps(saved_location, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(
+                saved_location, ensure_ascii=False, indent=2
+            ).encode("utf-8")
+        try:
+            uploads_dir = cls._get_uploads_dir(create=True)
+            storage_file = uploads_dir / _LOCATION_FILE_NAME
+            # Write-and-rename so a crash mid-write never leaves a
+            # truncated location file behind.
+            tmp_file = storage_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, storage_file)
+        except OSError as e:
+            logger.error("위치 정보를 저장할 수 없습니다: %s", e)
+            return False
+        _last_saved_digest = digest
+        _saved_location_file_exists = True
+        st.session_state.saved_user_location = saved_location
+        return True
+
+    @classmethod
+    def _load_from_file(cls) -> Optional[Dict[str, Any]]:
+        storage_file = cls._get_uploads_dir() / _LOCATION_FILE_NAME
+        global _saved_location_file_exists
+        try:
+            raw = storage_file.read_bytes()
+            _saved_location_file_exists = True
+            if orjson is not None:
+                return orjson.loads(raw)
+            return json.loads(raw)
+        except FileNotFoundError:
+            _saved_location_file_exists = False
+            return None
+        except (OSError, ValueError) as e:
+            logger.error("저장된 위치를 읽을 수 없습니다: %s", e)
+            return None
+
+    @classmethod
+    def has_saved_user_location(cls) -> bool:
+        global _saved_location_file_exists
+        if st.session_state.get("saved_user_location") is not None:
+            return True
+        if _saved_location_file_exists is None:
+            _saved_location_file_exists = (
+                cls._get_uploads_dir() / _LOCATION_FILE_NAME
+            ).exists()
+        return _saved_location_file_exists
+
+    @classmethod
+    def load_saved_user_location(cls) -> Optional[Dict[str, Any]]:
+        saved = st.session_state.get("saved_user_location")
+        if saved is not None:
+            return saved
+        saved = cls._load_from_file()
+        if saved is not None:
+            st.session_state.saved_user_location = saved
+        return saved
+
+    @classmethod
+    def delete_saved_user_location(cls) -> bool:
+        storage_file = cls._get_uploads_dir() / _LOCATION_FILE_NAME
+        try:
+            storage_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.error("저장된 위치를 삭제할 수 없습니다: %s", e)
+            return False
+        global _saved_location_file_exists, _last_saved_digest
+        _saved_location_file_exists = False
+        _last_saved_digest = None
+        st.session_state.saved_user_location = None
+        return True
+
+    @classmethod
+    def _get_uploads_dir(cls, create: bool = False) -> Path:
+        uploads_dir = _uploads_dir_cached()
+        if create:
+            uploads_dir.mkdir(parents=True, exist_ok=True)
+        return uploads_dir
@@ -0,0 +1,47 @@
+"""Process-level app state helpers.
+
+Holds the state that lives outside Streamlit's session — most notably the
+development tunnel subprocess — so it survives script reruns.
+"""
+
+import subprocess
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(slots=True)
+class TunnelState:
+    """State of the development tunnel subprocess."""
+
+    proc: Optional[subprocess.Popen] = None
+    url: Optional[str] = None
+    is_running: bool = False
+
+    def stop(self) -> None:
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.terminate()
+        self.proc = None
+        self.url = None
+        self.is_running = False
+
+
+@dataclass(slots=True)
+class AppState:
+    """Mutable process-wide application state."""
+
+    debug: bool = False
+    tunnel: TunnelState = field(init=False)
+
+    def __post_init__(self):
+        self.tunnel = TunnelState()
+
+
+_app_state: Optional[AppState] = None
+
+
+def get_app_state() -> AppState:
+    """Return the process-wide AppState, creating it on first use."""
+    global _app_state
+    if _app_state is None:
+        _app_state = AppState()
+    return _app_state